@@ -0,0 +1,342 @@
+# -*- coding: utf-8 -*-
+"""
+PLMC - Benchmarks do Algoritmo Genético
+
+Gera instâncias sintéticas (fazendas espalhadas aleatoriamente ou em grupos) de vários tamanhos e raios
+de cobertura e mede, para cada uma:
+    - construção do índice de cobertura e da população inicial
+    - uma geração completa (torneio, crossover, mutação e avaliação)
+    - micro-benchmarks de calculaCobertura, calculaAptidao, gerarFilho e mutarPai
+    - vazão (filhos/s e avaliações/s) e pico de memória
+
+Os resultados são gravados em JSON para comparação entre commits:
+    python benchmark.py --saida base.json
+    python benchmark.py --saida atual.json --comparar base.json
+"""
+
+import argparse
+import gc
+import json
+import math
+import platform
+import random
+import subprocess
+import time
+import tracemalloc
+
+import numpy as np
+
+from implementacao import (
+    CacheAptidao,
+    IndiceCobertura,
+    antenasDe,
+    avaliarPopulacao,
+    calculaAptidao,
+    calculaCobertura,
+    executarGeracao,
+    gerarFilho,
+    gerarSolucaoAleatoria,
+    mutarPai,
+)
+
+# Densidade da instância de exemplo: 40 fazendas em uma região de cerca de 50 km × 50 km
+ladoPorFazenda = 50 / 40 ** 0.5
+
+# Acima desse tamanho a matriz de distâncias não é montada e o índice vem direto das coordenadas
+limiteMatrizDistancias = 5000
+
+# -------------------- INSTÂNCIAS SINTÉTICAS --------------------
+def gerarCoordenadas(numFazendas, tipo='aleatoria', semente=0):
+    """
+    Gera coordenadas de fazendas com a mesma densidade da instância de exemplo
+
+    parâmetros:
+        numFazendas: int - numero total de fazendas
+        tipo: str - 'aleatoria' (uniforme na região) ou 'agrupada' (grupos de ~40 fazendas)
+        semente: int - semente do gerador aleatório
+
+    saída:
+        float[][] - posição (x, y) de cada fazenda (km)
+    """
+    gerador = np.random.default_rng(semente)
+    lado = ladoPorFazenda * numFazendas ** 0.5
+
+    if tipo == 'aleatoria':
+        return gerador.uniform(0, lado, size=(numFazendas, 2))
+
+    if tipo == 'agrupada':
+        numGrupos = max(1, numFazendas // 40)
+        centros = gerador.uniform(0, lado, size=(numGrupos, 2))
+        grupos = gerador.integers(0, numGrupos, size=numFazendas)
+        return np.clip(centros[grupos] + gerador.normal(0, 8, size=(numFazendas, 2)), 0, lado)
+
+    raise ValueError('Tipo de instância desconhecido: {}'.format(tipo))
+
+def matrizDistancias(coordenadas):
+    """
+    Calcula a matriz de distâncias euclidianas (float32) entre as fazendas
+
+    parâmetros:
+        coordenadas: float[][] - posição (x, y) de cada fazenda (km)
+
+    saída:
+        float[][] - matriz com a distância entre cada fazenda (km)
+    """
+    diferencas = coordenadas[:, None, :] - coordenadas[None, :, :]
+    return np.sqrt(np.einsum('ijk,ijk->ij', diferencas, diferencas)).astype(np.float32)
+
+def construirIndice(coordenadas, coberturaAntena, distancias=None):
+    """
+    Constrói o índice de cobertura pelo mesmo caminho que uma instância real desse tamanho usaria.
+    Até limiteMatrizDistancias fazendas aceita a matriz de distâncias já calculada (como a de um arquivo lido).
+    """
+    if len(coordenadas) <= limiteMatrizDistancias:
+        if distancias is None:
+            distancias = matrizDistancias(coordenadas)
+        return IndiceCobertura(distancias, coberturaAntena)
+
+    return IndiceCobertura.deCoordenadas(coordenadas, coberturaAntena)
+
+# -------------------- MEDIÇÕES --------------------
+def cronometrar(funcao, repeticoes=1, rodadas=3, tempoMinimo=0.1):
+    """
+    Executa a função repetidas vezes e devolve o tempo médio por chamada (s) da rodada mais rápida,
+    o que descarta o aquecimento e reduz o ruído na comparação entre commits.
+    Uma chamada de aquecimento calibra cada rodada para durar ao menos tempoMinimo segundos
+    (e ter ao menos repeticoes chamadas), então funções curtas não ficam à mercê do ruído do sistema.
+    """
+    inicio = time.perf_counter()
+    funcao()
+    repeticoes = max(repeticoes, math.ceil(tempoMinimo / max(time.perf_counter() - inicio, 1e-9)))
+
+    # Como no timeit, o coletor de lixo fica desligado durante as rodadas para não interromper uma delas ao acaso
+    coletorLigado = gc.isenabled()
+    gc.disable()
+    try:
+        melhor = float('inf')
+        for _ in range(rodadas):
+            inicio = time.perf_counter()
+            for _ in range(repeticoes):
+                funcao()
+            melhor = min(melhor, (time.perf_counter() - inicio) / repeticoes)
+    finally:
+        if coletorLigado:
+            gc.enable()
+    return melhor
+
+def medirCaso(numFazendas, coberturaAntena, tipo, parametros, semente=0):
+    """
+    Mede um caso (tamanho, raio, tipo de instância)
+
+    parâmetros:
+        numFazendas: int - numero total de fazendas
+        coberturaAntena: int - a distancia coberta pela antena (km)
+        tipo: str - tipo de instância (ver gerarCoordenadas)
+        parametros: dict - tamanhoPopulacao, numPais, numFilhosCrossover, numFilhosMutacao, repeticoes e rodadas
+        semente: int - semente da instância e do algoritmo
+
+    saída:
+        dict - métricas do caso
+    """
+    random.seed(semente)
+    np.random.seed(semente)
+    coordenadas = gerarCoordenadas(numFazendas, tipo, semente)
+
+    rodadas = parametros['rodadas']
+
+    indice = construirIndice(coordenadas, coberturaAntena)
+    tempoIndice = cronometrar(lambda: construirIndice(coordenadas, coberturaAntena), rodadas=rodadas)
+
+    populacao = [gerarSolucaoAleatoria(indice) for _ in range(parametros['tamanhoPopulacao'])]
+    tempoInicializacao = cronometrar(
+        lambda: [gerarSolucaoAleatoria(indice) for _ in range(parametros['tamanhoPopulacao'])],
+        rodadas=rodadas
+    )
+
+    aptidoes, _ = avaliarPopulacao(populacao, indice)
+    tempoAvaliacao = cronometrar(lambda: avaliarPopulacao(populacao, indice), parametros['repeticoes'], rodadas)
+
+    # Cada rodada parte da mesma população inicial, com cache vazio
+    numFilhos = parametros['numFilhosCrossover'] + parametros['numFilhosMutacao']
+    tempoGeracao = cronometrar(lambda: executarGeracao(
+        populacao,
+        aptidoes,
+        indice,
+        parametros['numPais'],
+        parametros['numFilhosCrossover'],
+        parametros['numFilhosMutacao'],
+        CacheAptidao(),
+        tamanhoPopulacao=parametros['tamanhoPopulacao']
+    ), rodadas=rodadas)
+
+    repeticoes = parametros['repeticoes']
+    pai1, pai2 = populacao[0], populacao[1]
+    antenas = antenasDe(pai1)
+
+    return {
+        'numFazendas': numFazendas,
+        'coberturaAntena': coberturaAntena,
+        'tipo': tipo,
+        'paresCobertura': int(len(indice.indices)),
+        'antenasPorSolucao': float(np.mean([individuo.bit_count() for individuo in populacao])),
+        'tempoIndice': tempoIndice,
+        'tempoInicializacao': tempoInicializacao,
+        'tempoGeracao': tempoGeracao,
+        'tempoAvaliacao': tempoAvaliacao,
+        'filhosPorSegundo': numFilhos / tempoGeracao,
+        'avaliacoesPorSegundo': len(populacao) / tempoAvaliacao,
+        'calculaCobertura': cronometrar(lambda: calculaCobertura(antenas, indice), repeticoes, rodadas),
+        'calculaAptidao': cronometrar(lambda: calculaAptidao(antenas, indice), repeticoes, rodadas),
+        'gerarFilho': cronometrar(lambda: gerarFilho(pai1, pai2, indice), repeticoes, rodadas),
+        'mutarPai': cronometrar(lambda: mutarPai(pai1, indice), repeticoes, rodadas),
+        'picoMemoria': medirPicoMemoria(coordenadas, coberturaAntena, parametros),
+    }
+
+def medirPicoMemoria(coordenadas, coberturaAntena, parametros):
+    """
+    Pico de memória alocada (bytes) ao construir o índice, a população inicial e uma geração.
+    Executado à parte porque o tracemalloc deixa o código Python mais lento. A matriz de distâncias
+    (entrada da instância, não do algoritmo) é calculada antes, para que seus temporários não escondam o pico do algoritmo.
+    """
+    distancias = None
+    if len(coordenadas) <= limiteMatrizDistancias:
+        distancias = matrizDistancias(coordenadas)
+
+    tracemalloc.start()
+    try:
+        indice = construirIndice(coordenadas, coberturaAntena, distancias)
+        populacao = [gerarSolucaoAleatoria(indice) for _ in range(parametros['tamanhoPopulacao'])]
+        aptidoes, _ = avaliarPopulacao(populacao, indice)
+        executarGeracao(
+            populacao,
+            aptidoes,
+            indice,
+            parametros['numPais'],
+            parametros['numFilhosCrossover'],
+            parametros['numFilhosMutacao'],
+            tamanhoPopulacao=parametros['tamanhoPopulacao']
+        )
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+# -------------------- COMPARAÇÃO --------------------
+# Métricas de tempo/memória (menor é melhor) e de vazão (maior é melhor)
+metricasMenorMelhor = ['tempoIndice', 'tempoInicializacao', 'tempoGeracao', 'calculaCobertura',
+                       'calculaAptidao', 'gerarFilho', 'mutarPai', 'picoMemoria']
+metricasMaiorMelhor = ['filhosPorSegundo', 'avaliacoesPorSegundo']
+# Tempo por chamada de onde cada vazão é calculada
+duracaoVazao = {'filhosPorSegundo': 'tempoGeracao', 'avaliacoesPorSegundo': 'tempoAvaliacao'}
+
+def compararResultados(base, atual, tolerancia, limiteRuido=1e-3):
+    """
+    Compara dois arquivos de resultados caso a caso. Tempos por chamada abaixo de limiteRuido segundos
+    (e as vazões calculadas a partir deles) são mostrados, mas não contam como regressão: nessa escala
+    a variação entre duas execuções do mesmo commit já passa da tolerância
+
+    parâmetros:
+        base: dict - resultados de referência
+        atual: dict - resultados atuais
+        tolerancia: float - piora relativa aceita (ex.: 0.2 = 20%)
+        limiteRuido: float - tempo por chamada (s) abaixo do qual a métrica não é comparada
+
+    saída:
+        str[] - descrição de cada regressão encontrada
+    """
+    chave = lambda caso: (caso['numFazendas'], caso['coberturaAntena'], caso['tipo'])
+    casosBase = {chave(caso): caso for caso in base['resultados']}
+    regressoes = []
+
+    for caso in atual['resultados']:
+        referencia = casosBase.get(chave(caso))
+        if referencia is None:
+            continue
+
+        for metrica in metricasMenorMelhor + metricasMaiorMelhor:
+            if not referencia[metrica] or not caso[metrica]:
+                continue
+
+            razao = caso[metrica] / referencia[metrica]
+            if metrica in metricasMaiorMelhor:
+                razao = 1 / razao
+
+            duracao = None if metrica == 'picoMemoria' else referencia.get(duracaoVazao.get(metrica, metrica))
+            ruidoso = duracao is not None and duracao < limiteRuido
+
+            print('{:>6} fazendas, raio {:>5}, {:<9} {:<22} {:8.2f}x{}'.format(
+                *chave(caso), metrica, razao, '  (abaixo do limite de ruído)' if ruidoso else ''))
+
+            if razao > 1 + tolerancia and not ruidoso:
+                regressoes.append('{} fazendas, raio {}, {}: {} {:.2f}x pior'.format(*chave(caso), metrica, razao))
+
+    return regressoes
+
+def commitAtual():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+# -------------------- CÓDIGO PRINCIPAL --------------------
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(description='Benchmarks do algoritmo genético em instâncias sintéticas')
+    parser.add_argument('--tamanhos', type=int, nargs='+', default=[40, 400, 2000, 10000], help='quantidades de fazendas')
+    parser.add_argument('--raios', type=float, nargs='+', default=[5, 10, 20], help='raios de cobertura (km)')
+    parser.add_argument('--tipos', nargs='+', default=['aleatoria', 'agrupada'], help='tipos de instância')
+    parser.add_argument('--populacao', type=int, default=100, help='tamanho da população')
+    parser.add_argument('--pais', type=int, default=10, help='pais selecionados no torneio')
+    parser.add_argument('--filhos-crossover', type=int, default=60, help='filhos gerados por crossover')
+    parser.add_argument('--filhos-mutacao', type=int, default=30, help='filhos gerados por mutação')
+    parser.add_argument('--repeticoes', type=int, default=20, help='repetições mínimas por rodada dos micro-benchmarks')
+    parser.add_argument('--rodadas', type=int, default=5, help='rodadas de cada medição (vale a mais rápida)')
+    parser.add_argument('--semente', type=int, default=0, help='semente das instâncias e do algoritmo')
+    parser.add_argument('--saida', default='benchmark.json', help='arquivo JSON com os resultados')
+    parser.add_argument('--comparar', help='arquivo JSON de referência para detectar regressões')
+    parser.add_argument('--tolerancia', type=float, default=0.2, help='piora relativa aceita na comparação')
+    parser.add_argument('--limite-ruido', type=float, default=1e-3, help='tempo por chamada (s) abaixo do qual a métrica não é comparada')
+    argumentos = parser.parse_args(argumentos)
+
+    parametros = {
+        'tamanhoPopulacao': argumentos.populacao,
+        'numPais': argumentos.pais,
+        'numFilhosCrossover': argumentos.filhos_crossover,
+        'numFilhosMutacao': argumentos.filhos_mutacao,
+        'repeticoes': argumentos.repeticoes,
+        'rodadas': argumentos.rodadas,
+    }
+
+    resultados = []
+    for numFazendas in argumentos.tamanhos:
+        for coberturaAntena in argumentos.raios:
+            for tipo in argumentos.tipos:
+                caso = medirCaso(numFazendas, coberturaAntena, tipo, parametros, argumentos.semente)
+                resultados.append(caso)
+                print('{:>6} fazendas, raio {:>5}, {:<9} geração {:8.3f}s  {:10.1f} filhos/s  {:12.1f} avaliações/s  {:8.1f} MiB'.format(
+                    numFazendas, coberturaAntena, tipo, caso['tempoGeracao'], caso['filhosPorSegundo'],
+                    caso['avaliacoesPorSegundo'], caso['picoMemoria'] / 2 ** 20))
+
+    relatorio = {
+        'commit': commitAtual(),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'parametros': parametros,
+        'semente': argumentos.semente,
+        'resultados': resultados,
+    }
+
+    with open(argumentos.saida, 'w') as arquivo:
+        json.dump(relatorio, arquivo, indent=2)
+
+    if argumentos.comparar:
+        with open(argumentos.comparar) as arquivo:
+            regressoes = compararResultados(json.load(arquivo), relatorio, argumentos.tolerancia, argumentos.limite_ruido)
+
+        for regressao in regressoes:
+            print('REGRESSÃO:', regressao)
+
+        return 1 if regressoes else 0
+
+    return 0
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -13,252 +13,1918 @@ Número de pais selecionados em cada população: 100
 Número de filhos gerados por Crossover: 600
 Número de filhos gerados por Mutação: 300
 Estratégia adotada para o Crossover: Intercala os valores dos pais. Ex: [0, 1] + [2, 3] = [0, 2, 1, 3]
-Estratégia adotada para a Mutação: Remove uma posicao, testa e preenche com valores aleatórios se necessário
-Citério de parada: Testa se não houve melhora na aptidão nas últimas 50 execuções
+Estratégia adotada para a Mutação: Remove uma posicao, testa e, se necessário, repara com antenas que cobrem fazendas descobertas
+Reparo e poda: filhos e soluções iniciais só recebem antenas que cobrem alguma fazenda descoberta e perdem as antenas totalmente redundantes
+Citério de parada: Testa se não houve melhora na aptidão nas últimas 50 execuções (opcionalmente também tempo, avaliações ou aptidão alvo)
+
+Uso:
+    python implementacao.py [instancia.npy|.bin|.csv] --cobertura 10 --populacao 1000 ...
+    python implementacao.py coordenadas.npy --coordenadas --cobertura 10 ...
+    python implementacao.py instancia.npy --raios 5 10 15 20
+    python implementacao.py instancia.npy --tempo-maximo 30 --progresso --checkpoint execucao.npz
+    python implementacao.py instancia.npy --retomar execucao.npz --checkpoint execucao.npz
+    
+    ou, como biblioteca:
+    from implementacao import AlgoritmoGenetico, carregarDistancias
+    melhorAptidao, melhorSolucao = AlgoritmoGenetico(coberturaAntena=10).resolver(carregarDistancias('instancia.npy'))
+    
+    ou, recebendo cada melhoria enquanto o algoritmo executa:
+    algoritmo = AlgoritmoGenetico(coberturaAntena=10, tempoMaximo=30)
+    for melhorAptidao, melhorSolucao, geracao, tempoDecorrido in algoritmo.melhorias(IndiceCobertura(distancias, 10)):
+        ...
 """
 
+import argparse
+import cProfile
+import itertools
+import json
+import multiprocessing
+import os
 import random
+import sys
+import time
+from collections import OrderedDict
+from contextlib import nullcontext
+from concurrent.futures import ProcessPoolExecutor, wait
+from multiprocessing import shared_memory
+
 import numpy as np
 
-# -------------------- FUNÇÕES AUXILIARES --------------------
-def calculaCobertura(solucao, numFazendas, distanciasFazendas, coberturaAntena):
+# -------------------- INSTRUMENTAÇÃO --------------------
+# Contadores acumulados durante toda a execução; Telemetria registra a diferença de cada geração
+contadores = {
+    'atualizacoesCobertura': 0,
+    'lotesAvaliados': 0,
+    'avaliacoes': 0,
+    'iteracoesReparo': 0,
+    'antenasPodadas': 0,
+}
+
+semMedicao = nullcontext()
+
+class Telemetria:
+    """
+    Mede o tempo de cada fase das gerações e grava uma linha JSON por geração com os tempos, a melhor
+    aptidão e a média, as antenas da melhor solução, o contador de estagnação e os contadores de chamadas.
+    Sem telemetria (None) o algoritmo não mede nada.
+        
+    parâmetros:
+        arquivo: file - destino das linhas JSON (ex.: sys.stderr ou um arquivo .jsonl aberto para escrita)
+        perfilador: cProfile.Profile - perfilador ativado apenas nas gerações de geracoesPerfil (opcional)
+        geracoesPerfil: (int, int) - intervalo [início, fim) de gerações perfiladas
+    """
+    def __init__(self, arquivo, perfilador=None, geracoesPerfil=(0, 0)):
+        self.arquivo = arquivo
+        self.perfilador = perfilador
+        self.geracoesPerfil = geracoesPerfil
+        self.tempos = {}
+        self.inicioGeracao = 0.0
+        self.contadoresInicio = dict(contadores)
+        self.perfilando = False
+
+    def fase(self, nome):
+        return MedicaoFase(self.tempos, nome)
+
+    def iniciarGeracao(self, geracao):
+        self.tempos = {}
+        self.contadoresInicio = dict(contadores)
+        self.inicioGeracao = time.perf_counter()
+        
+        inicioPerfil, fimPerfil = self.geracoesPerfil
+        if self.perfilador is not None and inicioPerfil <= geracao < fimPerfil:
+            self.perfilador.enable()
+            self.perfilando = True
+
+    def registrarGeracao(self, geracao, aptidoes, melhorAptidao, melhorSolucao, vezesManteveAptidao):
+        if self.perfilando:
+            self.perfilador.disable()
+            self.perfilando = False
+        
+        registro = {
+            'geracao': geracao,
+            'tempoTotal': time.perf_counter() - self.inicioGeracao,
+            'tempos': self.tempos,
+            'melhorAptidao': float(melhorAptidao),
+            'aptidaoMedia': float(np.mean(aptidoes)),
+            'antenasMelhorSolucao': len(melhorSolucao),
+            'vezesManteveAptidao': vezesManteveAptidao,
+            'tamanhoPopulacao': len(aptidoes),
+            'contadores': {nome: contadores[nome] - self.contadoresInicio[nome] for nome in contadores},
+        }
+        self.arquivo.write(json.dumps(registro) + '\n')
+        self.arquivo.flush()
+
+class MedicaoFase:
+    """
+    Context manager que soma em tempos[nome] a duração do bloco
+    """
+    def __init__(self, tempos, nome):
+        self.tempos = tempos
+        self.nome = nome
+
+    def __enter__(self):
+        self.inicio = time.perf_counter()
+
+    def __exit__(self, *excecao):
+        self.tempos[self.nome] = self.tempos.get(self.nome, 0.0) + time.perf_counter() - self.inicio
+
+# -------------------- FUNÇÕES AUXILIARES --------------------
+def paresProximos(coordenadas, raio, tamanhoBloco=65536, ordenarPorDistancia=False):
+    """
+    Encontra, para cada fazenda, as fazendas a no máximo raio km, sem montar a matriz de distâncias.
+    As fazendas são distribuídas em uma grade de células com lado raio, então cada fazenda só é
+    comparada com as da própria célula e das 8 células vizinhas.
+        
+    parâmetros:
+        coordenadas: float[][] - posição (x, y) de cada fazenda (km)
+        raio: float - distância máxima (km)
+        tamanhoBloco: int - quantidade de fazendas processadas por vez (limita a memória temporária)
+        ordenarPorDistancia: bool - ordena os vizinhos de cada fazenda por distância em vez de por posição
+        
+    saída:
+        int[] - ponteiros no formato CSR (numFazendas + 1 posições)
+        int[] - vizinhos de cada fazenda, concatenados
+        float[] - distância (km) de cada par
+    """
+    coordenadas = np.asarray(coordenadas, dtype=np.float64)
+    numFazendas = len(coordenadas)
+    ponteiros = np.zeros(numFazendas + 1, dtype=np.int64)
+    
+    if numFazendas == 0:
+        return ponteiros, np.empty(0, dtype=np.int32), np.empty(0)
+    
+    # Células deslocadas em 1 para que as vizinhas de borda não "dobrem" para a coluna seguinte
+    celulas = np.floor((coordenadas - coordenadas.min(axis=0)) / max(raio, 1e-9)).astype(np.int64) + 1
+    numLinhasGrade = celulas[:, 1].max() + 2
+    chaves = celulas[:, 0] * numLinhasGrade + celulas[:, 1]
+    
+    ordem = np.argsort(chaves, kind='stable')
+    chavesOrdenadas = chaves[ordem]
+    deslocamentos = [dx * numLinhasGrade + dy for dx in (-1, 0, 1) for dy in (-1, 0, 1)]
+    raioQuadrado = raio * raio
+    
+    grau = np.zeros(numFazendas, dtype=np.int64)
+    indices = []
+    distancias = []
+    
+    for inicio in range(0, numFazendas, tamanhoBloco):
+        fazendas = np.arange(inicio, min(inicio + tamanhoBloco, numFazendas))
+        origens = []
+        destinos = []
+        quadrados = []
+        
+        for deslocamento in deslocamentos:
+            chavesVizinhas = chaves[fazendas] + deslocamento
+            esquerda = np.searchsorted(chavesOrdenadas, chavesVizinhas, side='left')
+            direita = np.searchsorted(chavesOrdenadas, chavesVizinhas, side='right')
+            quantidades = direita - esquerda
+            
+            origem = np.repeat(fazendas, quantidades)
+            inicioFaixas = np.repeat(np.cumsum(quantidades) - quantidades, quantidades)
+            destino = ordem[np.repeat(esquerda, quantidades) + np.arange(len(origem)) - inicioFaixas]
+            
+            diferencas = coordenadas[origem] - coordenadas[destino]
+            quadrado = np.einsum('ij,ij->i', diferencas, diferencas)
+            dentro = quadrado <= raioQuadrado
+            origens.append(origem[dentro])
+            destinos.append(destino[dentro])
+            quadrados.append(quadrado[dentro])
+        
+        origens = np.concatenate(origens)
+        destinos = np.concatenate(destinos)
+        quadrados = np.concatenate(quadrados)
+        
+        if ordenarPorDistancia:
+            ordemPares = np.lexsort((destinos, quadrados, origens))
+        else:
+            ordemPares = np.lexsort((destinos, origens))
+        
+        grau[fazendas] = np.bincount(origens - inicio, minlength=len(fazendas))
+        indices.append(destinos[ordemPares].astype(np.int32))
+        distancias.append(np.sqrt(quadrados[ordemPares]))
+    
+    np.cumsum(grau, out=ponteiros[1:])
+    
+    return ponteiros, np.concatenate(indices), np.concatenate(distancias)
+
+class IndiceCobertura:
+    """
+    Índice de cobertura pré-calculado uma única vez por instância, guardado como listas de adjacência
+    no formato CSR: as fazendas cobertas pela antena i são indices[ponteiros[i]:ponteiros[i + 1]].
+    A memória cresce com a quantidade de pares (antena, fazenda coberta), e não com numFazendas².
+        
+    parâmetros:
+        distanciasFazendas: int[][] - matriz com a distância entre cada fazenda (km); pode ser um memmap
+        coberturaAntena: int - a distancia coberta pela antena (km)
+        tamanhoBloco: int - quantidade de linhas comparadas por vez
+        
+    atributos:
+        numFazendas: int - numero total de fazendas
+        ponteiros: int[] - início, em indices, das fazendas cobertas por cada antena (numFazendas + 1 posições)
+        indices: int[] - fazendas cobertas, concatenadas antena a antena
+        vizinhos: int[][] - para cada antena, vetor com as fazendas cobertas por ela
+        cobridores: int[][] - para cada fazenda, vetor com as antenas que a cobrem (transposta de vizinhos)
+        ponteirosCobridores: int[] - início, em antenasCobridores, das antenas que cobrem cada fazenda
+        antenasCobridores: int[] - antenas que cobrem cada fazenda, concatenadas (a transposta em CSR)
+        grau: int[] - quantidade de fazendas cobertas por cada antena
+        matrizPesos: float[][] - matriz float32 onde [i][j] = 1 se a antena i cobre a fazenda j, usada nos produtos
+            matriciais da avaliação em lote; None quando a instância passa de limiteDenso fazendas
+    """
+    limiteDenso = 4096
+
+    def __init__(self, distanciasFazendas, coberturaAntena, tamanhoBloco=1024):
+        # Compara por blocos de linhas para não materializar uma cópia da matriz de distâncias (ex.: memmap)
+        distancias = distanciasFazendas if isinstance(distanciasFazendas, np.ndarray) else np.asarray(distanciasFazendas)
+        grau = []
+        indices = []
+        
+        for inicio in range(0, len(distancias), tamanhoBloco):
+            cobertas = distancias[inicio:inicio + tamanhoBloco] <= coberturaAntena
+            grau.append(np.count_nonzero(cobertas, axis=1))
+            indices.append(np.nonzero(cobertas)[1].astype(np.int32))
+        
+        ponteiros = np.zeros(len(distancias) + 1, dtype=np.int64)
+        if grau:
+            np.cumsum(np.concatenate(grau), out=ponteiros[1:])
+            indices = np.concatenate(indices)
+        else:
+            indices = np.empty(0, dtype=np.int32)
+        
+        self.definirCsr(ponteiros, indices)
+
+    @classmethod
+    def deCsr(cls, ponteiros, indices, transposta=None, matrizPesos=None):
+        """
+        Cria o índice diretamente a partir das listas de adjacência já calculadas
+            
+        parâmetros:
+            ponteiros, indices: int[] - listas de adjacência (ver atributos)
+            transposta: (int[], int[]) - ponteirosCobridores e antenasCobridores já calculados (opcional)
+            matrizPesos: float[][] - matriz densa já calculada, ex.: em memória compartilhada (opcional)
+        """
+        indice = cls.__new__(cls)
+        indice.definirCsr(ponteiros, indices, transposta, matrizPesos)
+        return indice
+
+    @classmethod
+    def deCoordenadas(cls, coordenadas, coberturaAntena, tamanhoBloco=65536):
+        """
+        Cria o índice a partir das coordenadas das fazendas, sem matriz de distâncias (ver paresProximos)
+            
+        parâmetros:
+            coordenadas: float[][] - posição (x, y) de cada fazenda (km)
+            coberturaAntena: int - a distancia coberta pela antena (km)
+            tamanhoBloco: int - quantidade de antenas processadas por vez (limita a memória temporária)
+        """
+        ponteiros, indices, _ = paresProximos(coordenadas, coberturaAntena, tamanhoBloco)
+        return cls.deCsr(ponteiros, indices)
+
+    def definirCsr(self, ponteiros, indices, transposta=None, matrizPesos=None):
+        self.ponteiros = ponteiros
+        self.indices = indices
+        self.numFazendas = len(ponteiros) - 1
+        self.grau = np.diff(ponteiros)
+        self.vizinhos = [indices[ponteiros[i]:ponteiros[i + 1]] for i in range(self.numFazendas)]
+        
+        # Transposta das listas de adjacência: usada no reparo para sortear apenas antenas úteis
+        if transposta is None:
+            antenas = np.repeat(np.arange(self.numFazendas, dtype=np.int32), self.grau)[np.argsort(indices, kind='stable')]
+            ponteirosCobridores = np.zeros(self.numFazendas + 1, dtype=np.int64)
+            np.cumsum(np.bincount(indices, minlength=self.numFazendas), out=ponteirosCobridores[1:])
+            transposta = (ponteirosCobridores, antenas)
+        
+        ponteirosCobridores, antenas = transposta
+        self.ponteirosCobridores = ponteirosCobridores
+        self.antenasCobridores = antenas
+        self.cobridores = [antenas[ponteirosCobridores[i]:ponteirosCobridores[i + 1]] for i in range(self.numFazendas)]
+        self.matrizPesos = matrizPesos
+        
+        if matrizPesos is None and self.numFazendas <= self.limiteDenso:
+            self.matrizPesos = np.zeros((self.numFazendas, self.numFazendas), dtype=np.float32)
+            self.matrizPesos[np.repeat(np.arange(self.numFazendas), self.grau), indices] = 1
+
+class IndiceVizinhosOrdenados:
+    """
+    Para cada fazenda, as fazendas a no máximo raioMaximo km ordenadas por distância (formato CSR).
+    O conjunto coberto por uma antena com qualquer raio até raioMaximo é um prefixo da sua lista,
+    então o índice de cobertura de cada raio sai de um único filtro, sem percorrer as distâncias de novo.
+        
+    atributos:
+        raioMaximo: float - maior raio atendido pelo índice (km)
+        ponteiros: int[] - início, em indices, dos vizinhos de cada fazenda (numFazendas + 1 posições)
+        indices: int[] - vizinhos de cada fazenda, do mais próximo ao mais distante
+        distancias: float[] - distância (km) de cada vizinho em indices
+    """
+    def __init__(self, ponteiros, indices, distancias, raioMaximo):
+        self.ponteiros = ponteiros
+        self.indices = indices
+        self.distancias = distancias
+        self.raioMaximo = raioMaximo
+
+    @classmethod
+    def deDistancias(cls, distanciasFazendas, raioMaximo, tamanhoBloco=1024):
+        """
+        Cria o índice a partir da matriz de distâncias, lida por blocos de linhas (aceita memmap)
+            
+        parâmetros:
+            distanciasFazendas: int[][] - matriz com a distância entre cada fazenda (km)
+            raioMaximo: float - maior raio que será consultado (km)
+            tamanhoBloco: int - quantidade de linhas lidas por vez
+        """
+        distancias = distanciasFazendas if isinstance(distanciasFazendas, np.ndarray) else np.asarray(distanciasFazendas)
+        grau = []
+        indices = []
+        valores = []
+        
+        for inicio in range(0, len(distancias), tamanhoBloco):
+            bloco = np.asarray(distancias[inicio:inicio + tamanhoBloco])
+            linhas, colunas = np.nonzero(bloco <= raioMaximo)
+            distanciasBloco = bloco[linhas, colunas]
+            ordem = np.lexsort((colunas, distanciasBloco, linhas))
+            
+            grau.append(np.bincount(linhas, minlength=len(bloco)))
+            indices.append(colunas[ordem].astype(np.int32))
+            valores.append(distanciasBloco[ordem])
+        
+        ponteiros = np.zeros(len(distancias) + 1, dtype=np.int64)
+        if grau:
+            np.cumsum(np.concatenate(grau), out=ponteiros[1:])
+            return cls(ponteiros, np.concatenate(indices), np.concatenate(valores), raioMaximo)
+        
+        return cls(ponteiros, np.empty(0, dtype=np.int32), np.empty(0), raioMaximo)
+
+    @classmethod
+    def deCoordenadas(cls, coordenadas, raioMaximo):
+        """
+        Cria o índice a partir das coordenadas das fazendas (ver paresProximos)
+        """
+        ponteiros, indices, distancias = paresProximos(coordenadas, raioMaximo, ordenarPorDistancia=True)
+        return cls(ponteiros, indices, distancias, raioMaximo)
+
+    def csrParaRaio(self, coberturaAntena):
+        """
+        Listas de adjacência (CSR) de um raio, a partir dos prefixos das listas ordenadas
+            
+        parâmetros:
+            coberturaAntena: float - a distancia coberta pela antena (km), até raioMaximo
+            
+        saída:
+            int[] - ponteiros (ver IndiceCobertura)
+            int[] - indices (ver IndiceCobertura)
+        """
+        if coberturaAntena > self.raioMaximo:
+            raise ValueError('Raio {} maior que o raio máximo do índice ({})'.format(coberturaAntena, self.raioMaximo))
+        
+        dentro = self.distancias <= coberturaAntena
+        acumulado = np.zeros(len(dentro) + 1, dtype=np.int64)
+        np.cumsum(dentro, out=acumulado[1:])
+        
+        return acumulado[self.ponteiros], self.indices[dentro]
+
+    def indiceParaRaio(self, coberturaAntena):
+        """
+        Monta o índice de cobertura de um raio a partir dos prefixos das listas ordenadas (ver csrParaRaio)
+        """
+        return IndiceCobertura.deCsr(*self.csrParaRaio(coberturaAntena))
+
+class EstadoCobertura:
+    """
+    Mantém, de forma incremental, quantas antenas cobrem cada fazenda de uma solução em construção.
+    Adicionar ou remover uma antena custa O(grau) em vez de recalcular a cobertura inteira.
+        
+    parâmetros:
+        indice: IndiceCobertura - índice de cobertura da instância
+        solucao: int[] - antenas iniciais (opcional)
+    """
+    def __init__(self, indice, solucao=()):
+        self.indice = indice
+        
+        if len(solucao) == 0:
+            self.contagem = np.zeros(indice.numFazendas, dtype=np.int32)
+        else:
+            cobertas = np.concatenate([indice.vizinhos[antena] for antena in solucao])
+            self.contagem = np.bincount(cobertas, minlength=indice.numFazendas).astype(np.int32)
+        
+        self.descobertas = int(np.count_nonzero(self.contagem == 0))
+
+    def adicionar(self, antena):
+        contadores['atualizacoesCobertura'] += 1
+        vizinhos = self.indice.vizinhos[antena]
+        self.descobertas -= np.count_nonzero(self.contagem[vizinhos] == 0)
+        self.contagem[vizinhos] += 1
+
+    def remover(self, antena):
+        contadores['atualizacoesCobertura'] += 1
+        vizinhos = self.indice.vizinhos[antena]
+        self.contagem[vizinhos] -= 1
+        self.descobertas += np.count_nonzero(self.contagem[vizinhos] == 0)
+
+    def cobreTodas(self):
+        return self.descobertas == 0
+
+    def redundante(self, antena):
+        """
+        Indica se todas as fazendas cobertas pela antena também são cobertas por outra antena da solução
+        """
+        return bool(np.all(self.contagem[self.indice.vizinhos[antena]] >= 2))
+
+class CacheAptidao:
+    """
+    Cache LRU com a aptidão e a cobertura de soluções já avaliadas, indexado pela forma canônica da solução
+        
+    parâmetros:
+        tamanhoMaximo: int - quantidade máxima de soluções mantidas (as menos usadas recentemente são descartadas)
+        
+    atributos:
+        acertos: int - quantidade de avaliações evitadas pelo cache
+        falhas: int - quantidade de soluções que precisaram ser avaliadas
+    """
+    def __init__(self, tamanhoMaximo=100000):
+        self.tamanhoMaximo = tamanhoMaximo
+        self.entradas = OrderedDict()
+        self.acertos = 0
+        self.falhas = 0
+
+    @staticmethod
+    def chave(solucao):
+        """
+        Forma canônica da solução: o bitset das antenas (a ordem das antenas não altera a aptidão)
+        """
+        return solucao if isinstance(solucao, int) else paraBits(solucao)
+
+    def buscar(self, chave):
+        resultado = self.entradas.get(chave)
+        
+        if resultado is None:
+            self.falhas += 1
+        else:
+            self.acertos += 1
+            self.entradas.move_to_end(chave)
+            
+        return resultado
+
+    def guardar(self, chave, resultado):
+        self.entradas[chave] = resultado
+        self.entradas.move_to_end(chave)
+        
+        if len(self.entradas) > self.tamanhoMaximo:
+            self.entradas.popitem(last=False)
+
+    def taxaAcertos(self):
+        consultas = self.acertos + self.falhas
+        return self.acertos / consultas if consultas else 0.0
+
+def calculaCobertura(solucao, indice):
+    """
+    Calcula quantas fazendas foram cobertas pela solução recebida via parâmetro
+        
+    parâmetros:
+        solucao: int[] - vetor com as posicoes das antenas
+        indice: IndiceCobertura - índice de cobertura da instância
+        
+    saída:
+        int - quantidade de fazendas cobertas
+    """
+    if len(solucao) == 0:
+        return 0
+    
+    return len(np.unique(np.concatenate([indice.vizinhos[antena] for antena in solucao])))
+
+def dividirVetor(vetor, quantidadeGrupos):
+    """
+    Divide o vetor em N vetores iguais (quanto for possível) e os retorna em uma matriz
+
+    parâmetros:
+        vetor: [] - vetor de quaisquer elementos
+        quantidadeGrupos: int - quantidade de vetores a serem gerados
+        
+    saída:
+        [][] - matriz resultante
+    """
+    return np.array_split(vetor, quantidadeGrupos)
+
+def calculaAptidao(solucao, indice):
+    """
+    Calcula a aptidão da solução recebida
+    
+    parâmetros:
+        solucao: int[] - vetor com as posicoes das antenas
+        indice: IndiceCobertura - índice de cobertura da instância
+        
+    saída:
+        float - razão entre a redundancia (cobertura) e a quantidade de antenas
+    """
+    redundancia = indice.grau[solucao].sum()
+    return float(redundancia/len(solucao))
+
+def paraBits(solucao):
+    """
+    Converte uma solução em vetor de posições para a representação compacta dos indivíduos
+        
+    parâmetros:
+        solucao: int[] - vetor com as posicoes das antenas
+        
+    saída:
+        int - bitset onde o bit i vale 1 se há antena na fazenda i
+    """
+    if len(solucao) == 0:
+        return 0
+    
+    bits = np.zeros(int(max(solucao)) + 1, dtype=np.uint8)
+    bits[np.asarray(solucao, dtype=np.intp)] = 1
+    
+    return int.from_bytes(np.packbits(bits, bitorder='little').tobytes(), 'little')
+
+def antenasDe(individuo):
+    """
+    Converte um indivíduo (bitset) de volta para o vetor de posições das antenas, em ordem crescente
+        
+    parâmetros:
+        individuo: int - bitset onde o bit i vale 1 se há antena na fazenda i
+        
+    saída:
+        int[] - vetor com as posicoes das antenas
+    """
+    dados = individuo.to_bytes((individuo.bit_length() + 7) // 8, 'little')
+    bits = np.unpackbits(np.frombuffer(dados, dtype=np.uint8), bitorder='little')
+    
+    return np.flatnonzero(bits).tolist()
+
+def removerDuplicados(populacao):
+    """
+    Remove indivíduos repetidos, mantendo a primeira ocorrência de cada um
+        
+    parâmetros:
+        populacao: int[] - indivíduos (bitsets)
+        
+    saída:
+        int[] - população sem repetições
+        int[] - posição, na população original, de cada indivíduo mantido
+    """
+    posicoes = {}
+    
+    for posicao, individuo in enumerate(populacao):
+        posicoes.setdefault(individuo, posicao)
+    
+    return list(posicoes), np.fromiter(posicoes.values(), dtype=np.intp, count=len(posicoes))
+
+def repararSolucao(antenas, estado, indice):
+    """
+    Completa a cobertura de uma solução: a cada passo sorteia uma fazenda ainda descoberta e adiciona
+    uma antena, também sorteada, entre as que a cobrem. Nenhuma antena adicionada é inútil.
+        
+    parâmetros:
+        antenas: int[] - posições das antenas da solução (alterado no próprio vetor)
+        estado: EstadoCobertura - estado de cobertura das antenas (alterado junto com o vetor)
+        indice: IndiceCobertura - índice de cobertura da instância
+        
+    saída:
+        int[] - o mesmo vetor antenas, agora cobrindo todas as fazendas
+    """
+    descobertas = np.flatnonzero(estado.contagem == 0)
+    
+    while len(descobertas):
+        fazenda = descobertas[random.randrange(len(descobertas))]
+        candidatas = indice.cobridores[fazenda]
+        antena = int(candidatas[random.randrange(len(candidatas))])
+        
+        estado.adicionar(antena)
+        antenas.append(antena)
+        contadores['iteracoesReparo'] += 1
+        
+        descobertas = descobertas[estado.contagem[descobertas] == 0]
+    
+    return antenas
+
+def podarRedundantes(antenas, estado, indice):
+    """
+    Remove, em ordem aleatória, as antenas cuja cobertura é totalmente redundante (todas as fazendas
+    continuam cobertas sem elas) e cuja remoção não reduz a aptidão, isto é, que cobrem no máximo a
+    média de fazendas por antena da solução.
+        
+    parâmetros:
+        antenas: int[] - posições das antenas de uma solução válida
+        estado: EstadoCobertura - estado de cobertura das antenas (alterado junto com a poda)
+        indice: IndiceCobertura - índice de cobertura da instância
+        
+    saída:
+        int[] - antenas mantidas
+    """
+    redundancia = int(indice.grau[antenas].sum())
+    quantidade = len(antenas)
+    removidas = set()
+    
+    for antena in random.sample(antenas, len(antenas)):
+        if quantidade == 1:
+            break
+        
+        if indice.grau[antena] * quantidade <= redundancia and estado.redundante(antena):
+            estado.remover(antena)
+            removidas.add(antena)
+            redundancia -= int(indice.grau[antena])
+            quantidade -= 1
+    
+    contadores['antenasPodadas'] += len(removidas)
+    
+    return [antena for antena in antenas if antena not in removidas]
+
+def gerarSolucaoAleatoria(indice):
+    """
+    Gera uma solução válida pelo reparo direcionado a partir de uma solução vazia e poda as antenas redundantes
+        
+    parâmetros:
+        indice: IndiceCobertura - índice de cobertura da instância
+        
+    saída:
+        int - indivíduo (bitset das antenas)
+    """
+    estado = EstadoCobertura(indice)
+    solucao = repararSolucao([], estado, indice)
+    
+    return paraBits(podarRedundantes(solucao, estado, indice))
+
+def adaptarPopulacao(populacao, indice, tamanhoPopulacao, interromper=None):
+    """
+    Reaproveita uma população de outra instância (ex.: outro raio de cobertura) como população inicial:
+    cada indivíduo é reparado, se deixou de cobrir todas as fazendas, e podado, se ficou redundante.
+    Repetidos são descartados e as vagas restantes são preenchidas com soluções aleatórias.
+        
+    parâmetros:
+        populacao: int[] - indivíduos (bitsets) a reaproveitar
+        indice: IndiceCobertura - índice de cobertura da nova instância
+        tamanhoPopulacao: int - tamanho da população resultante
+        interromper: função - consultada antes de cada indivíduo; devolvendo True, a população fica menor (opcional)
+        
+    saída:
+        int[] - nova população (com pelo menos um indivíduo)
+    """
+    adaptados = []
+    
+    for individuo in populacao[:tamanhoPopulacao]:
+        if adaptados and interromper is not None and interromper():
+            return adaptados
+        
+        antenas = antenasDe(individuo)
+        estado = EstadoCobertura(indice, antenas)
+        repararSolucao(antenas, estado, indice)
+        adaptados.append(paraBits(podarRedundantes(antenas, estado, indice)))
+    
+    adaptados, _ = removerDuplicados(adaptados)
+    
+    while len(adaptados) < tamanhoPopulacao:
+        if adaptados and interromper is not None and interromper():
+            break
+        
+        adaptados.append(gerarSolucaoAleatoria(indice))
+    
+    return adaptados
+
+def codificarPopulacao(populacao, numFazendas):
+    """
+    Codifica a população como uma matriz 0/1 (indivíduos × fazendas), desempacotando os bitsets
+        
+    parâmetros:
+        populacao: int[] - indivíduos (bitsets)
+        numFazendas: int - numero total de fazendas
+        
+    saída:
+        float[][] - matriz onde a posição [i][j] vale 1 se o indivíduo i possui antena na fazenda j
+    """
+    numBytes = (numFazendas + 7) // 8
+    dados = b''.join(individuo.to_bytes(numBytes, 'little') for individuo in populacao)
+    bytesPopulacao = np.frombuffer(dados, dtype=np.uint8).reshape(len(populacao), numBytes)
+    
+    return np.unpackbits(bytesPopulacao, axis=1, count=numFazendas, bitorder='little').astype(np.float32)
+
+def avaliarLote(populacao, indice):
+    """
+    Calcula a aptidão e a cobertura de todos os indivíduos com um único produto matricial
+    (ou, em instâncias grandes sem matriz densa, a partir das listas de adjacência)
+        
+    parâmetros:
+        populacao: int[] - indivíduos (bitsets, ver paraBits)
+        indice: IndiceCobertura - índice de cobertura da instância
+        
+    saída:
+        float[] - aptidão de cada indivíduo (mesma razão de calculaAptidao)
+        int[] - quantidade de fazendas cobertas por cada indivíduo
+    """
+    contadores['lotesAvaliados'] += 1
+    contadores['avaliacoes'] += len(populacao)
+    
+    if indice.matrizPesos is None:
+        return avaliarLoteEsparso(populacao, indice)
+    
+    individuos = codificarPopulacao(populacao, indice.numFazendas)
+    coberturaPorFazenda = individuos @ indice.matrizPesos
+    
+    redundancias = coberturaPorFazenda.sum(axis=1, dtype=np.float64)
+    aptidoes = redundancias / individuos.sum(axis=1, dtype=np.float64)
+    coberturas = np.count_nonzero(coberturaPorFazenda, axis=1)
+    
+    return aptidoes, coberturas
+
+def avaliarLoteEsparso(populacao, indice):
+    """
+    Mesmo resultado de avaliarLote usando apenas as listas de adjacência do índice
+    """
+    aptidoes = np.empty(len(populacao))
+    coberturas = np.empty(len(populacao), dtype=np.int64)
+    
+    for posicao, individuo in enumerate(populacao):
+        cobertas = np.concatenate([indice.vizinhos[antena] for antena in antenasDe(individuo)])
+        
+        aptidoes[posicao] = len(cobertas) / individuo.bit_count()
+        coberturas[posicao] = len(np.unique(cobertas))
+    
+    return aptidoes, coberturas
+
+def avaliarPopulacao(populacao, indice, cache=None):
+    """
+    Calcula a aptidão e a cobertura de toda a população, avaliando em lote apenas as soluções ausentes do cache
+        
+    parâmetros:
+        populacao: int[] - indivíduos (bitsets, ver paraBits)
+        indice: IndiceCobertura - índice de cobertura da instância
+        cache: CacheAptidao - cache de soluções já avaliadas (opcional)
+        
+    saída:
+        float[] - aptidão de cada indivíduo (mesma razão de calculaAptidao)
+        int[] - quantidade de fazendas cobertas por cada indivíduo
+    """
+    if cache is None:
+        return avaliarLote(populacao, indice)
+    
+    aptidoes = np.empty(len(populacao))
+    coberturas = np.empty(len(populacao), dtype=np.int64)
+    pendentes = {}
+    
+    for posicao, solucao in enumerate(populacao):
+        chave = cache.chave(solucao)
+        
+        if chave in pendentes:
+            # Repetida dentro da própria população: será avaliada uma única vez
+            pendentes[chave].append(posicao)
+            cache.acertos += 1
+            continue
+        
+        resultado = cache.buscar(chave)
+        
+        if resultado is None:
+            pendentes[chave] = [posicao]
+        else:
+            aptidoes[posicao], coberturas[posicao] = resultado
+    
+    if pendentes:
+        chaves = list(pendentes)
+        aptidoesNovas, coberturasNovas = avaliarLote(chaves, indice)
+        
+        for chave, aptidao, cobertura in zip(chaves, aptidoesNovas, coberturasNovas):
+            cache.guardar(chave, (aptidao, cobertura))
+            aptidoes[pendentes[chave]] = aptidao
+            coberturas[pendentes[chave]] = cobertura
+    
+    return aptidoes, coberturas
+
+def selecionarPais(populacao, aptidoes, quantidadePais):
+    """
+    Seleciona os melhores pais utilizando a estratégia torneio.
+    
+    parâmetros:
+        populacao: int[] - indivíduos (bitsets, ver paraBits)
+        aptidoes: float[] - aptidão de cada indivíduo da população (ver avaliarPopulacao)
+        quantidadePais: int - quantidade de pais a ser selecionada
+        
+    saída:
+        int[] - pais selecionados no torneio
+    """
+    posicoes = np.random.choice(
+        np.arange(len(populacao)),
+        size=len(populacao),
+        replace=False
+    )
+    
+    gruposPosicoes = dividirVetor(posicoes, quantidadePais)
+    
+    selecionados = []
+    
+    for posicoes in gruposPosicoes:
+        # Sem indivíduos repetidos a população pode ser menor que quantidadePais
+        if len(posicoes) == 0:
+            continue
+        
+        posicaoMelhorRedundancia = posicoes[np.argmax(aptidoes[posicoes])]
+        selecionados.append(populacao[posicaoMelhorRedundancia])
+    
+    return selecionados
+
+def gerarFilho(pai1, pai2, indice):
+    """
+    Gera um filho por crossover a partir de dois pais distintos, intercalando suas antenas
+    (em ordem crescente de posição) até cobrir todas as fazendas; completa a cobertura com o reparo
+    direcionado se necessário e poda as antenas redundantes
+    
+    parâmetros:
+        pai1: int - indivíduo (bitset das antenas)
+        pai2: int - indivíduo (bitset das antenas)
+        indice: IndiceCobertura - índice de cobertura da instância
+        
+    saída:
+        int - filho gerado a partir dos dois pais recebidos
+    """
+    antenasPai1 = antenasDe(pai1)
+    antenasPai2 = antenasDe(pai2)
+    
+    filhoFinal = 0
+    antenas = []
+    estado = EstadoCobertura(indice)
+    
+    maiorPai = max(len(antenasPai1), len(antenasPai2))
+    
+    for i in range(maiorPai):
+        if i < len(antenasPai1) and not filhoFinal >> antenasPai1[i] & 1:
+            filhoFinal |= 1 << antenasPai1[i]
+            antenas.append(antenasPai1[i])
+            estado.adicionar(antenasPai1[i])
+            
+            if estado.cobreTodas():
+                break
+            
+        if i < len(antenasPai2) and not filhoFinal >> antenasPai2[i] & 1:
+            filhoFinal |= 1 << antenasPai2[i]
+            antenas.append(antenasPai2[i])
+            estado.adicionar(antenasPai2[i])
+            
+            if estado.cobreTodas():
+                break
+    
+    repararSolucao(antenas, estado, indice)
+    
+    return paraBits(podarRedundantes(antenas, estado, indice))
+
+def gerarFilhosPorCrossover(pais, numFilhos, indice, interromper=None):
+    """
+    Dado o número de filhos a serem gerados, sorteia dois pais e gera um filho.
+    Se restar um único pai distinto (ex.: depois de removidos os repetidos), ele é cruzado consigo mesmo.
+    
+    parâmetros:
+        pais: int[] - indivíduos (bitsets das antenas)
+        numFilhos: int - número de filhos desejado
+        indice: IndiceCobertura - índice de cobertura da instância
+        interromper: função - consultada antes de cada filho; devolvendo True, para com os filhos já gerados (opcional)
+        
+    saída:
+        int[] - filhos gerados
+    """
+    filhos = []
+    
+    for i in range(numFilhos):
+        if interromper is not None and interromper():
+            break
+        
+        posicaoPai1, posicaoPai2 = np.random.choice(
+            np.arange(len(pais)),
+            size=2,
+            replace=len(pais) < 2
+        )
+        
+        filhoGerado = gerarFilho(pais[posicaoPai1], pais[posicaoPai2], indice)
+        filhos.append(filhoGerado)
+        
+    return filhos
+
+def mutarPai(pai, indice):
+    """
+    Dado um pai, gera um filho por mutação
+    
+    parâmetros:
+        pai: int - indivíduo (bitset das antenas)
+        indice: IndiceCobertura - índice de cobertura da instância
+        
+    saída:
+        int - filho gerado
+    """
+    antenas = antenasDe(pai)
+    antenaRemovida = random.choice(antenas)
+    antenas.remove(antenaRemovida)
+    
+    estado = EstadoCobertura(indice, antenas)
+    
+    if estado.cobreTodas():
+        return pai & ~(1 << antenaRemovida)
+    
+    repararSolucao(antenas, estado, indice)
+    
+    return paraBits(podarRedundantes(antenas, estado, indice))
+
+def gerarFilhosPorMutacao(pais, numFilhos, indice, interromper=None):
+    """
+    Dado o número de filhos a serem gerados, sorteia um pai e realiza a mutação
+    
+    parâmetros:
+        pais: int[] - indivíduos (bitsets das antenas)
+        numFilhos: int - número de filhos desejado
+        indice: IndiceCobertura - índice de cobertura da instância
+        interromper: função - consultada antes de cada filho (ver gerarFilhosPorCrossover)
+        
+    saída:
+        int[] - filhos gerados
+    """
+    filhos = []
+    
+    for i in range(numFilhos):
+        if interromper is not None and interromper():
+            break
+        
+        posicaoPai = random.randint(0, len(pais) - 1)
+        
+        filhoGerado = mutarPai(pais[posicaoPai], indice)
+        filhos.append(filhoGerado)
+        
+    return filhos
+
+def completarPopulacao(populacao, aptidoes, tamanhoPopulacao, geradores, maximoRodadas=10, interromper=None):
+    """
+    Completa a população que ficou menor que tamanhoPopulacao depois de removidos os repetidos.
+    Cada gerador é usado por até maximoRodadas rodadas, na ordem recebida, e os novos indivíduos também
+    não se repetem; se todos se esgotarem a população fica menor.
+        
+    parâmetros:
+        populacao: int[] - população sem repetições (bitsets)
+        aptidoes: float[] - aptidão de cada indivíduo da população
+        tamanhoPopulacao: int - tamanho desejado da população
+        geradores: função[] - cada uma recebe a quantidade de indivíduos e devolve os indivíduos e suas aptidões
+        maximoRodadas: int - rodadas de cada gerador antes de passar ao próximo
+        interromper: função - consultada antes de cada rodada; devolvendo True, a população fica menor (opcional)
+        
+    saída:
+        int[] - população completada
+        float[] - aptidão de cada indivíduo da população completada
+    """
+    for gerarNovos in geradores:
+        for _ in range(maximoRodadas):
+            if len(populacao) >= tamanhoPopulacao or (interromper is not None and interromper()):
+                return populacao, aptidoes
+            
+            novos, aptidoesNovos = gerarNovos(tamanhoPopulacao - len(populacao))
+            populacao, posicoes = removerDuplicados(populacao + novos)
+            aptidoes = np.concatenate([aptidoes, aptidoesNovos])[posicoes]
+    
+    return populacao, aptidoes
+
+def executarGeracao(populacao, aptidoes, indice, numPais, numFilhosCrossover, numFilhosMutacao, cache=None, gerador=None, telemetria=None, tamanhoPopulacao=None,
+                    interromper=None, maximoNovos=None):
     """
-    Calcula quantas fazendas foram cobertas pela solução recebida via parâmetro
+    Executa uma geração do algoritmo: torneio, crossover, mutação e avaliação da nova população.
+    Indivíduos repetidos são removidos ao montar a nova população, e as vagas abertas por eles são
+    preenchidas com mutações da nova população ou, se elas só repetirem, soluções aleatórias (ver completarPopulacao).
         
     parâmetros:
-        solucao: int[] - vetor com as posicoes das antenas
-        numFazendas: int - numero total de fazendas
-        distanciasFazendas: int[][] - matriz com a distância entre cada fazenda (km)
-        coberturaAntena: int - a distancia coberta pela antena (km)
+        populacao: int[] - população atual (bitsets)
+        aptidoes: float[] - aptidão de cada indivíduo da população atual
+        indice: IndiceCobertura - índice de cobertura da instância
+        numPais: int - quantidade de pais selecionados no torneio
+        numFilhosCrossover: int - número de filhos gerados por crossover
+        numFilhosMutacao: int - número de filhos gerados por mutação
+        cache: CacheAptidao - cache de soluções já avaliadas (opcional)
+        gerador: GeradorParalelo - gera os filhos em paralelo (opcional)
+        telemetria: Telemetria - mede o tempo de cada fase (opcional)
+        tamanhoPopulacao: int - tamanho mínimo da nova população (None = pais mais filhos, sem os repetidos)
+        interromper: função - consultada antes de cada filho; devolvendo True, a geração termina com os filhos
+            já gerados (opcional; ex.: prazo esgotado)
+        maximoNovos: int - máximo de indivíduos novos (filhos e reposição) criados na geração (None = sem limite)
         
     saída:
-        int - quantidade de fazendas cobertas
-        
+        int[] - nova população
+        float[] - aptidão de cada indivíduo da nova população
     """
+    fase = telemetria.fase if telemetria is not None else lambda nome: semMedicao
     
-    fazendasCobertas = [0] * numFazendas
+    if maximoNovos is not None:
+        numFilhosCrossover = min(numFilhosCrossover, maximoNovos)
+        numFilhosMutacao = min(numFilhosMutacao, maximoNovos - numFilhosCrossover)
+        maximoNovos -= numFilhosCrossover + numFilhosMutacao
     
-    for fazendaA in solucao:
-        for fazendaB in range(numFazendas):
-            if distanciasFazendas[fazendaA][fazendaB] <= coberturaAntena:
-                fazendasCobertas[fazendaB] = 1
-                
-    return sum(fazendasCobertas)
+    # Torneio
+    with fase('torneio'):
+        paisSelecionados = selecionarPais(populacao, aptidoes, numPais)
+    
+    if gerador is None:
+        with fase('crossover'):
+            filhosPorCrossover = gerarFilhosPorCrossover(paisSelecionados, numFilhosCrossover, indice, interromper)
+        
+        with fase('mutacao'):
+            filhosPorMutacao = gerarFilhosPorMutacao(paisSelecionados, numFilhosMutacao, indice, interromper)
+        
+        with fase('avaliacao'):
+            populacao, _ = removerDuplicados(paisSelecionados + filhosPorCrossover + filhosPorMutacao)
+            aptidoes, _ = avaliarPopulacao(populacao, indice, cache)
+        
+        def gerarMutantes(quantidade):
+            filhos = gerarFilhosPorMutacao(populacao, quantidade, indice, interromper)
+            return filhos, avaliarPopulacao(filhos, indice, cache)[0]
+    else:
+        # Crossover, mutação e avaliação dos filhos acontecem juntos nos processos trabalhadores
+        with fase('filhosParalelos'):
+            filhos, aptidoesFilhos, _ = gerador.gerarFilhos(paisSelecionados, numFilhosCrossover, numFilhosMutacao, interromper)
+        
+        with fase('avaliacao'):
+            aptidoesPais, _ = avaliarPopulacao(paisSelecionados, indice, cache)
+            populacao, posicoes = removerDuplicados(paisSelecionados + filhos)
+            aptidoes = np.concatenate([aptidoesPais, aptidoesFilhos])[posicoes]
+        
+        def gerarMutantes(quantidade):
+            filhos, aptidoesFilhos, _ = gerador.gerarFilhos(populacao, 0, quantidade, interromper)
+            return filhos, aptidoesFilhos
+    
+    def gerarAleatorios(quantidade):
+        novos = []
+        while len(novos) < quantidade and (interromper is None or not interromper()):
+            novos.append(gerarSolucaoAleatoria(indice))
+        return novos, avaliarPopulacao(novos, indice, cache)[0]
+    
+    if tamanhoPopulacao is not None:
+        if maximoNovos is not None:
+            tamanhoPopulacao = min(tamanhoPopulacao, len(populacao) + maximoNovos)
+        
+        with fase('reposicao'):
+            populacao, aptidoes = completarPopulacao(
+                populacao, aptidoes, tamanhoPopulacao, [gerarMutantes, gerarAleatorios], interromper=interromper
+            )
+    
+    return populacao, aptidoes
 
+# -------------------- GERAÇÃO PARALELA --------------------
+# Índice de cobertura de cada processo trabalhador, montado uma única vez sobre a memória compartilhada
+memoriaProcesso = None
+indiceProcesso = None
 
-def dividirVetor(vetor, quantidadeGrupos):
+def inicializarProcesso(nomeMemoria, formatoIndice):
     """
-    Divide o vetor em N vetores iguais (quanto for possível) e os retorna em uma matriz
+    Inicializador dos processos trabalhadores: anexa o índice compartilhado (ver indiceCompartilhado)
+        
+    parâmetros:
+        nomeMemoria: str - nome do bloco de memória compartilhada com o índice de cobertura
+        formatoIndice: (int, int, bool) - formato do índice (ver compartilharIndice)
+    """
+    global memoriaProcesso, indiceProcesso
+    
+    memoriaProcesso, indiceProcesso = indiceCompartilhado(nomeMemoria, formatoIndice)
 
+def gerarLoteFilhos(pais, numFilhosCrossover, numFilhosMutacao, semente):
+    """
+    Tarefa executada nos processos trabalhadores: gera e avalia um lote de filhos
+        
     parâmetros:
-        vetor: [] - vetor de quaisquer elementos
-        quantidadeGrupos: int - quantidade de vetores a serem gerados
+        pais: int[] - indivíduos (bitsets das antenas)
+        numFilhosCrossover: int - número de filhos gerados por crossover no lote
+        numFilhosMutacao: int - número de filhos gerados por mutação no lote
+        semente: int - semente do gerador aleatório do lote
         
     saída:
-        [][] - matriz resultante
+        int[] - filhos gerados
+        float[] - aptidão de cada filho
+        int[] - quantidade de fazendas cobertas por cada filho
+        dict - contadores de instrumentação acumulados pelo lote
     """
+    contadoresInicio = dict(contadores)
+    random.seed(semente)
+    np.random.seed(semente)
     
-    return np.array_split(vetor, quantidadeGrupos)
+    filhos = gerarFilhosPorCrossover(pais, numFilhosCrossover, indiceProcesso)
+    filhos += gerarFilhosPorMutacao(pais, numFilhosMutacao, indiceProcesso)
+    
+    aptidoes, coberturas = avaliarLote(filhos, indiceProcesso)
+    
+    return filhos, aptidoes, coberturas, {nome: contadores[nome] - contadoresInicio[nome] for nome in contadores}
 
-def calculaAptidao(solucao, distanciasFazendas, numFazendas, coberturaAntena):
+def vetoresCompartilhados(memoria, formatoIndice):
     """
-    Calcula a aptidão da solução recebida
-    
-    parâmetros:
-        solucao: int[] - vetor com as posicoes das antenas
-        distanciasFazendas: int[][] - matriz com a distância entre cada fazenda (km)
-        numFazendas: int - numero total de fazendas
-        coberturaAntena: int - a distancia coberta pela antena (km)
+    Visões (sem cópia) dos vetores do índice guardados no bloco de memória compartilhada.
+    Os vetores de 8 bytes vêm primeiro para que todos fiquem alinhados.
         
     saída:
-        float - razão entre a redundancia (cobertura) e a quantidade de antenas
+        int[] - ponteiros
+        int[] - indices
+        (int[], int[]) - ponteirosCobridores e antenasCobridores
+        float[][] - matrizPesos (None se o índice não tem matriz densa)
     """
+    numFazendas, numPares, denso = formatoIndice
+    formatos = [
+        (numFazendas + 1, np.int64),
+        (numFazendas + 1, np.int64),
+        ((numFazendas, numFazendas) if denso else 0, np.float32),
+        (numPares, np.int32),
+        (numPares, np.int32),
+    ]
     
-    redundancia = 0
-    
-    for fazendaAntena in solucao:
-        for posicaoFazenda in range(numFazendas):
-            if distanciasFazendas[fazendaAntena][posicaoFazenda] <= coberturaAntena:
-                redundancia += 1
+    vetores = []
+    deslocamento = 0
+    for formato, tipo in formatos:
+        vetor = np.ndarray(formato, dtype=tipo, buffer=memoria.buf, offset=deslocamento)
+        vetores.append(vetor)
+        deslocamento += vetor.nbytes
     
+    ponteiros, ponteirosCobridores, matrizPesos, indices, antenasCobridores = vetores
     
-    return redundancia/len(solucao)
+    return ponteiros, indices, (ponteirosCobridores, antenasCobridores), matrizPesos if denso else None
 
-def selecionarPais(populacao, quantidadePais, distanciasFazendas, numFazendas, coberturaAntena):
+def compartilharIndice(indice):
     """
-    Seleciona os melhores pais utilizando a estratégia torneio.
-    
+    Copia o índice para um bloco de memória compartilhada: as listas de adjacência, a transposta e,
+    se houver, a matriz densa, para que nenhum processo trabalhador precise recalculá-las (ver indiceCompartilhado)
+        
     parâmetros:
-        populacao: int[][] - matriz onde cada 'linha' se refere a um indivíduo e cada 'coluna' se refere a uma posição da antena (a fazenda em questão)
-        quantidadePais: int - quantidade de pais a ser selecionada
-        distanciasFazendas: int[][] - matriz com a distância entre cada fazenda (km)
-        numFazendas: int - numero total de fazendas
-        coberturaAntena: int - a distancia coberta pela antena (km)
+        indice: IndiceCobertura - índice de cobertura da instância
         
     saída:
-        int[][] - matriz representando os pais selecionados no torneio
+        SharedMemory - bloco criado; quem o cria é responsável por chamar close() e unlink()
+        (int, int, bool) - formato do índice (fazendas, pares e se há matriz densa), repassado a inicializarProcesso
     """
+    formatoIndice = (indice.numFazendas, len(indice.indices), indice.matrizPesos is not None)
+    tamanho = 2 * 8 * (indice.numFazendas + 1) + 2 * 4 * len(indice.indices)
+    if indice.matrizPesos is not None:
+        tamanho += indice.matrizPesos.astype(np.float32).nbytes
     
-    posicoes = np.random.choice(
-        np.arange(len(populacao)),
-        size=len(populacao),
-        replace=False
-    )
+    memoria = shared_memory.SharedMemory(create=True, size=max(tamanho, 1))
+    ponteiros, indices, (ponteirosCobridores, antenasCobridores), matrizPesos = vetoresCompartilhados(memoria, formatoIndice)
+    ponteiros[:] = indice.ponteiros
+    indices[:] = indice.indices
+    ponteirosCobridores[:] = indice.ponteirosCobridores
+    antenasCobridores[:] = indice.antenasCobridores
+    if matrizPesos is not None:
+        matrizPesos[:] = indice.matrizPesos
     
-    gruposPosicoes = dividirVetor(posicoes, quantidadePais)
-    melhores = []
-    selecionados = []
+    return memoria, formatoIndice
+
+def indiceCompartilhado(nomeMemoria, formatoIndice):
+    """
+    Anexa um bloco criado por compartilharIndice e monta o índice sobre ele, sem copiar nem recalcular
+    os vetores; apenas as listas de visões (vizinhos e cobridores) são criadas no processo
+        
+    saída:
+        SharedMemory - bloco anexado; deve continuar aberto enquanto o índice for usado
+        IndiceCobertura - índice sobre a memória compartilhada
+    """
+    memoria = shared_memory.SharedMemory(name=nomeMemoria)
+    ponteiros, indices, transposta, matrizPesos = vetoresCompartilhados(memoria, formatoIndice)
     
-    for posicoes in gruposPosicoes:
-        melhorAptidao = 0
-        posicaoMelhorRedundancia = None
+    return memoria, IndiceCobertura.deCsr(ponteiros, indices, transposta, matrizPesos)
+
+def dividirQuantidade(total, tamanhoLote):
+    """
+    Divide uma quantidade em lotes de no máximo tamanhoLote elementos
+        
+    saída:
+        int[] - tamanho de cada lote
+    """
+    if total <= 0:
+        return []
+    
+    return [len(lote) for lote in dividirVetor(np.arange(total), -(-total // tamanhoLote))]
+
+class GeradorParalelo:
+    """
+    Gera e avalia os filhos de cada geração em um ProcessPoolExecutor.
+    O índice de cobertura é copiado uma única vez para memória compartilhada; cada lote de filhos
+    recebe uma semente própria derivada da semente principal, então o resultado depende apenas da
+    semente e da divisão em lotes, e não da ordem em que os processos terminam.
+        
+    parâmetros:
+        indice: IndiceCobertura - índice de cobertura da instância
+        numProcessos: int - quantidade de processos trabalhadores
+        tamanhoLote: int - quantidade máxima de filhos por tarefa
+        semente: int - semente principal (None para não reprodutível)
+    """
+    def __init__(self, indice, numProcessos, tamanhoLote=50, semente=None):
+        self.tamanhoLote = tamanhoLote
+        self.sementes = np.random.SeedSequence(semente)
+        
+        self.memoria, formatoIndice = compartilharIndice(indice)
         
-        for posicaoIndividuo in posicoes:
-            aptidaoAtual = calculaAptidao(populacao[posicaoIndividuo], distanciasFazendas, numFazendas, coberturaAntena)
+        self.executor = ProcessPoolExecutor(
+            numProcessos,
+            initializer=inicializarProcesso,
+            initargs=(self.memoria.name, formatoIndice)
+        )
+
+    def gerarFilhos(self, pais, numFilhosCrossover, numFilhosMutacao, interromper=None):
+        """
+        Gera os filhos por crossover e por mutação de uma geração.
+        Com interromper, os lotes ainda não iniciados são cancelados quando ela devolve True e os lotes
+        seguintes ao primeiro não concluído são descartados; os que já executam vão até o fim (fechar os espera).
             
-            if aptidaoAtual > melhorAptidao:
-                melhorAptidao = aptidaoAtual
-                posicaoMelhorRedundancia = posicaoIndividuo
-                
-        melhores.append(posicaoMelhorRedundancia.item())
+        saída:
+            int[] - filhos gerados (primeiro os de crossover, depois os de mutação)
+            float[] - aptidão de cada filho
+            int[] - quantidade de fazendas cobertas por cada filho
+        """
+        tarefas = [(quantidade, 0) for quantidade in dividirQuantidade(numFilhosCrossover, self.tamanhoLote)]
+        tarefas += [(0, quantidade) for quantidade in dividirQuantidade(numFilhosMutacao, self.tamanhoLote)]
+        sementes = [int(filha.generate_state(1)[0]) for filha in self.sementes.spawn(len(tarefas))]
         
-    for posicao in melhores:
-        selecionados.append(populacao[posicao])
+        futuros = [
+            self.executor.submit(gerarLoteFilhos, pais, crossover, mutacao, semente)
+            for (crossover, mutacao), semente in zip(tarefas, sementes)
+        ]
         
-    return selecionados
+        filhos = []
+        aptidoes = [np.empty(0)]
+        coberturas = [np.empty(0, dtype=np.int64)]
+        
+        for posicao, futuro in enumerate(futuros):
+            while interromper is not None and not futuro.done():
+                if interromper():
+                    for pendente in futuros[posicao:]:
+                        pendente.cancel()
+                    return filhos, np.concatenate(aptidoes), np.concatenate(coberturas)
+                
+                wait([futuro], timeout=0.01)
+            
+            filhosLote, aptidoesLote, coberturasLote, contadoresLote = futuro.result()
+            filhos += filhosLote
+            aptidoes.append(aptidoesLote)
+            coberturas.append(coberturasLote)
+            
+            for nome, quantidade in contadoresLote.items():
+                contadores[nome] += quantidade
+        
+        return filhos, np.concatenate(aptidoes), np.concatenate(coberturas)
+
+    def fechar(self):
+        self.executor.shutdown()
+        self.memoria.close()
+        self.memoria.unlink()
 
-def gerarFilho(pai1, pai2, numFazendas, distanciasFazendas, coberturaAntena):
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excecao):
+        self.fechar()
+
+# -------------------- MODELO DE ILHAS --------------------
+def executarIlha(conexao, nomeMemoria, formatoIndice, parametros, semente):
+    """
+    Processo de uma ilha: mantém a própria população e, a cada época, recebe migrantes,
+    executa parametros['geracoesPorEpoca'] gerações e devolve seus migrantes e seu melhor indivíduo
+        
+    parâmetros:
+        conexao: Connection - extremidade do Pipe usada para conversar com o processo principal
+        nomeMemoria: str - nome do bloco de memória compartilhada com o índice de cobertura
+        formatoIndice: (int, int, bool) - formato do índice (ver compartilharIndice)
+        parametros: dict - parâmetros do algoritmo (ver executarIlhas)
+        semente: int - semente do gerador aleatório da ilha
     """
-    Gera um filho por crossover a partir de dois pais distintos
+    inicializarProcesso(nomeMemoria, formatoIndice)
+    random.seed(semente)
+    np.random.seed(semente)
+    
+    cache = CacheAptidao(parametros['tamanhoCache'])
+    populacao = [gerarSolucaoAleatoria(indiceProcesso) for _ in range(parametros['tamanhoPopulacao'])]
+    aptidoes, _ = avaliarPopulacao(populacao, indiceProcesso, cache)
+    
+    while True:
+        migrantes = conexao.recv()
+        
+        if migrantes is None:
+            break
+        
+        # Os migrantes substituem os piores indivíduos da ilha
+        for posicao, migrante in zip(np.argsort(aptidoes), migrantes):
+            populacao[posicao] = migrante
+            
+        if migrantes:
+            aptidoes, _ = avaliarPopulacao(populacao, indiceProcesso, cache)
+        
+        for _ in range(parametros['geracoesPorEpoca']):
+            populacao, aptidoes = executarGeracao(
+                populacao,
+                aptidoes,
+                indiceProcesso,
+                parametros['numPais'],
+                parametros['numFilhosCrossover'],
+                parametros['numFilhosMutacao'],
+                cache,
+                tamanhoPopulacao=parametros['tamanhoPopulacao']
+            )
+        
+        melhores = np.argsort(aptidoes)[::-1]
+        migrantes = [populacao[posicao] for posicao in melhores[:parametros['numMigrantes']]]
+        conexao.send((migrantes, populacao[melhores[0]], float(aptidoes[melhores[0]])))
     
+    conexao.close()
+
+def executarIlhas(indice, numIlhas, parametros, maximaEpocasSemMelhora, semente=None):
+    """
+    Executa o algoritmo genético em várias ilhas, cada uma em seu próprio processo.
+    A cada época (parametros['geracoesPorEpoca'] gerações) os parametros['numMigrantes'] melhores
+    indivíduos de cada ilha migram para a próxima ilha do anel, substituindo os piores dela.
+        
     parâmetros:
-        pai1: int[] - vetor contendo as posições das antenas
-        pai2: int[] - vetor contendo as posições das antenas
-        numFazendas: int - numero total de fazendas
-        distanciasFazendas: int[][] - matriz com a distância entre cada fazenda (km)
-        coberturaAntena: int - a distancia coberta pela antena (km)
+        indice: IndiceCobertura - índice de cobertura da instância
+        numIlhas: int - quantidade de ilhas (processos)
+        parametros: dict - tamanhoPopulacao, numPais, numFilhosCrossover, numFilhosMutacao, tamanhoCache, geracoesPorEpoca e numMigrantes de cada ilha
+        maximaEpocasSemMelhora: int - para quando nenhuma ilha melhora a melhor aptidão global nesse número de épocas
+        semente: int - semente principal (None para não reprodutível)
         
     saída:
-        int[] - filho gerado a partir dos dois pais recebidos
+        float - melhor aptidão encontrada
+        int[] - melhor solução encontrada
     """
+    contexto = multiprocessing.get_context()
+    memoria, formatoIndice = compartilharIndice(indice)
+    sementes = [int(filha.generate_state(1)[0]) for filha in np.random.SeedSequence(semente).spawn(numIlhas)]
     
-    filhoFinal = set()
-    cobreTodasFazendas = False
-    
-    maiorPai = max(len(pai1), len(pai2))
+    conexoes = []
+    processos = []
     
-    for i in range(maiorPai):
-        if i < len(pai1) and not pai1[i] in filhoFinal:
-            filhoFinal.add(pai1[i])
-            
-            cobreTodasFazendas = calculaCobertura(list(filhoFinal), numFazendas, distanciasFazendas, coberturaAntena) == numFazendas
+    try:
+        for sementeIlha in sementes:
+            conexao, conexaoIlha = contexto.Pipe()
+            processo = contexto.Process(
+                target=executarIlha,
+                args=(conexaoIlha, memoria.name, formatoIndice, parametros, sementeIlha),
+                daemon=True
+            )
+            processo.start()
+            conexoes.append(conexao)
+            processos.append(processo)
+        
+        melhorAptidao = 0
+        melhorSolucao = None
+        
+        epocasSemMelhora = 0
+        migrantes = [[] for _ in range(numIlhas)]
+        
+        while epocasSemMelhora < maximaEpocasSemMelhora:
+            epocasSemMelhora += 1
             
-            if cobreTodasFazendas:
-                break
+            for conexao, migrantesIlha in zip(conexoes, migrantes):
+                conexao.send(migrantesIlha)
             
-        if i < len(pai2) and not pai2[i] in filhoFinal:
-            filhoFinal.add(pai2[i])
+            resultados = [conexao.recv() for conexao in conexoes]
             
-            cobreTodasFazendas = calculaCobertura(list(filhoFinal), numFazendas, distanciasFazendas, coberturaAntena) == numFazendas
+            for _, melhorIndividuo, aptidaoMelhor in resultados:
+                if aptidaoMelhor > melhorAptidao:
+                    melhorAptidao = aptidaoMelhor
+                    melhorSolucao = antenasDe(melhorIndividuo)
+                    epocasSemMelhora = 0
             
-            if cobreTodasFazendas:
-                break
+            # Topologia em anel: a ilha i recebe os melhores da ilha i - 1
+            migrantes = [resultados[ilha - 1][0] for ilha in range(numIlhas)]
         
-    while not cobreTodasFazendas:
-        novaAntena = random.randint(0, numFazendas)
+        for conexao in conexoes:
+            conexao.send(None)
         
-        if not novaAntena in filhoFinal:
-            filhoFinal.add(novaAntena)
-            
-            cobreTodasFazendas = calculaCobertura(list(filhoFinal), numFazendas, distanciasFazendas, coberturaAntena) == numFazendas
+        for processo in processos:
+            processo.join()
+    finally:
+        for processo in processos:
+            if processo.is_alive():
+                processo.terminate()
+        
+        memoria.close()
+        memoria.unlink()
     
-    return list(filhoFinal)
+    return melhorAptidao, melhorSolucao
 
-def gerarFilhosPorCrossover(pais, numFilhos, numFazendas, distanciasFazendas, coberturaAntena):
+# -------------------- CARREGAMENTO DE INSTÂNCIAS --------------------
+def carregarDistancias(caminho, tamanhoBloco=1024):
     """
-    Dado o número de filhos a serem gerados, sorteia dois pais e gera um filho
-    
+    Carrega a matriz de distâncias de um arquivo sem passar por listas Python
+        
+    Formatos aceitos:
+        .npy - aberto com memory mapping (np.load(mmap_mode='r'))
+        .bin / .f32 - float32 binário bruto, quadrado, aberto com np.memmap
+        .csv - lido em blocos de tamanhoBloco linhas para uma matriz float32
+        
     parâmetros:
-        pais: int[][] - matriz contendo as posições das antenas
-        numFilhos: int - número de filhos desejado
-        numFazendas: int - numero total de fazendas
-        distanciasFazendas: int[][] - matriz com a distância entre cada fazenda (km)
-        coberturaAntena: int - a distancia coberta pela antena (km)
+        caminho: str - caminho do arquivo
+        tamanhoBloco: int - quantidade de linhas lidas por vez no CSV
         
     saída:
-        int[][] - matriz de filhos gerados
+        float[][] - matriz de distâncias (km)
     """
+    extensao = os.path.splitext(caminho)[1].lower()
     
-    filhos = []
+    if extensao == '.npy':
+        distancias = np.load(caminho, mmap_mode='r')
+    elif extensao in ('.bin', '.f32'):
+        distancias = np.memmap(caminho, dtype=np.float32, mode='r')
+        numFazendas = int(round(len(distancias) ** 0.5))
+        
+        if numFazendas * numFazendas != len(distancias):
+            raise ValueError('O arquivo {} não contém uma matriz quadrada de float32'.format(caminho))
+        
+        distancias = distancias.reshape(numFazendas, numFazendas)
+    elif extensao == '.csv':
+        distancias = carregarCsv(caminho, tamanhoBloco)
+    else:
+        raise ValueError('Formato de instância não suportado: {}'.format(extensao))
     
-    for i in range(numFilhos):
-        posicaoPai1, posicaoPai2 = np.random.choice(
-            np.arange(len(pais)),
-            size=2,
-            replace=False
-        )
+    if distancias.ndim != 2 or distancias.shape[0] != distancias.shape[1]:
+        raise ValueError('A matriz de distâncias deve ser quadrada, recebido {}'.format(distancias.shape))
+    
+    return distancias
+
+def carregarCsv(caminho, tamanhoBloco=1024):
+    """
+    Lê uma matriz de distâncias em CSV (sem cabeçalho) em blocos de linhas
         
-        filhoGerado = gerarFilho(pais[posicaoPai1], pais[posicaoPai2], numFazendas, distanciasFazendas, coberturaAntena)
+    parâmetros:
+        caminho: str - caminho do arquivo
+        tamanhoBloco: int - quantidade de linhas lidas por vez
         
-        filhos.append(filhoGerado)
+    saída:
+        float[][] - matriz float32 de distâncias (km)
+    """
+    with open(caminho) as arquivo:
+        primeiraLinha = arquivo.readline()
+        numFazendas = len(primeiraLinha.split(','))
         
-    return filhos
+        distancias = np.empty((numFazendas, numFazendas), dtype=np.float32)
+        distancias[0] = np.array(primeiraLinha.split(','), dtype=np.float32)
+        
+        linha = 1
+        while linha < numFazendas:
+            bloco = np.loadtxt(itertools.islice(arquivo, tamanhoBloco), delimiter=',', dtype=np.float32, ndmin=2)
+            
+            if len(bloco) == 0:
+                break
+            
+            distancias[linha:linha + len(bloco)] = bloco
+            linha += len(bloco)
+    
+    if linha != numFazendas:
+        raise ValueError('O arquivo {} possui {} linhas, esperado {}'.format(caminho, linha, numFazendas))
+    
+    return distancias
 
-def mutarPai(pai, numFazendas, distanciasFazendas, coberturaAntena):
+def carregarCoordenadas(caminho):
     """
-    Dado um pai, gera um filho por mutação
-    
+    Carrega as coordenadas (x, y) das fazendas, usadas por IndiceCobertura.deCoordenadas em instâncias
+    grandes demais para uma matriz de distâncias
+        
+    Formatos aceitos:
+        .npy - matriz numFazendas × 2 aberta com memory mapping
+        .csv - duas colunas (x, y) em km, sem cabeçalho
+        
     parâmetros:
-        pai: int[] - vetor contendo as posições das antenas
-        numFazendas: int - numero total de fazendas
-        distanciasFazendas: int[][] - matriz com a distância entre cada fazenda (km)
-        coberturaAntena: int - a distancia coberta pela antena (km)
+        caminho: str - caminho do arquivo
         
     saída:
-        int[] - filhos gerados
+        float[][] - posição (x, y) de cada fazenda (km)
     """
+    extensao = os.path.splitext(caminho)[1].lower()
     
-    filho = pai[:]
+    if extensao == '.npy':
+        coordenadas = np.load(caminho, mmap_mode='r')
+    elif extensao == '.csv':
+        coordenadas = np.loadtxt(caminho, delimiter=',', dtype=np.float64, ndmin=2)
+    else:
+        raise ValueError('Formato de coordenadas não suportado: {}'.format(extensao))
     
-    antenaRemovida = random.choice(filho)
-    filho.remove(antenaRemovida)
+    if coordenadas.ndim != 2 or coordenadas.shape[1] != 2:
+        raise ValueError('As coordenadas devem ter duas colunas (x, y), recebido {}'.format(coordenadas.shape))
     
-    while calculaCobertura(filho, numFazendas, distanciasFazendas, coberturaAntena) < numFazendas:
-        antenasDisponiveis = set(range(numFazendas)) - set(filho)
-        
-        if antenasDisponiveis:
-            novaAntena = random.choice(list(antenasDisponiveis))
-            filho.append(novaAntena)
-            
-    return filho
+    return coordenadas
 
-def gerarFilhosPorMutacao(pais, numFilhos, numFazendas, distanciasFazendas, coberturaAntena):
+# -------------------- CHECKPOINTS --------------------
+def capturarEstadoAleatorio():
     """
-    Dado o número de filhos a serem gerados, sorteia um pai e realiza a mutação
-    
+    Estado dos geradores aleatórios globais (random e np.random), para que uma execução retomada
+    de um checkpoint continue exatamente a sequência da execução interrompida
+    """
+    return random.getstate(), np.random.get_state()
+
+def salvarCheckpoint(caminho, populacao, numFazendas, estado):
+    """
+    Grava a população e o estado do laço principal em um .npz comprimido. Cada indivíduo ocupa
+    (numFazendas + 7) // 8 bytes (o próprio bitset). O arquivo é escrito ao lado e depois renomeado,
+    então uma interrupção durante a gravação preserva o checkpoint anterior.
+        
     parâmetros:
-        pais: int[][] - matriz contendo as posições das antenas
-        numFilhos: int - número de filhos desejado
+        caminho: str - caminho do arquivo
+        populacao: int[] - indivíduos (bitsets)
         numFazendas: int - numero total de fazendas
-        distanciasFazendas: int[][] - matriz com a distância entre cada fazenda (km)
-        coberturaAntena: int - a distancia coberta pela antena (km)
+        estado: dict - geracao, melhorAptidao, melhorSolucao, vezesManteveAptidao, tempoDecorrido e
+            estadoAleatorio (ver capturarEstadoAleatorio)
+    """
+    (versaoRandom, internoRandom, gaussRandom), (_, chavesNumpy, posicaoNumpy, temGaussNumpy, gaussNumpy) = estado['estadoAleatorio']
+    numBytes = (numFazendas + 7) // 8
+    dados = b''.join(individuo.to_bytes(numBytes, 'little') for individuo in populacao)
+    temporario = '{}.tmp'.format(caminho)
+    
+    with open(temporario, 'wb') as arquivo:
+        np.savez_compressed(
+            arquivo,
+            populacao=np.frombuffer(dados, dtype=np.uint8).reshape(len(populacao), numBytes),
+            numFazendas=numFazendas,
+            geracao=estado['geracao'],
+            melhorAptidao=estado['melhorAptidao'],
+            melhorSolucao=np.asarray(estado['melhorSolucao'], dtype=np.int64),
+            vezesManteveAptidao=estado['vezesManteveAptidao'],
+            tempoDecorrido=estado['tempoDecorrido'],
+            versaoRandom=versaoRandom,
+            internoRandom=np.asarray(internoRandom, dtype=np.int64),
+            gaussRandom=np.nan if gaussRandom is None else gaussRandom,
+            chavesNumpy=chavesNumpy,
+            posicaoNumpy=posicaoNumpy,
+            gaussNumpy=np.array([temGaussNumpy, gaussNumpy], dtype=np.float64)
+        )
+    
+    os.replace(temporario, caminho)
+
+def carregarCheckpoint(caminho):
+    """
+    Lê um checkpoint gravado por salvarCheckpoint
+        
+    parâmetros:
+        caminho: str - caminho do arquivo
         
     saída:
-        int[][] - filhos gerados
+        int[] - população (bitsets)
+        dict - numFazendas e o estado do laço principal (ver salvarCheckpoint)
     """
+    with np.load(caminho) as dados:
+        populacao = [int.from_bytes(linha.tobytes(), 'little') for linha in dados['populacao']]
+        estado = {
+            'numFazendas': int(dados['numFazendas']),
+            'geracao': int(dados['geracao']),
+            'melhorAptidao': float(dados['melhorAptidao']),
+            'melhorSolucao': dados['melhorSolucao'].tolist(),
+            'vezesManteveAptidao': int(dados['vezesManteveAptidao']),
+            'tempoDecorrido': float(dados['tempoDecorrido']),
+            'estadoAleatorio': (
+                (
+                    int(dados['versaoRandom']),
+                    tuple(int(valor) for valor in dados['internoRandom']),
+                    None if np.isnan(dados['gaussRandom']) else float(dados['gaussRandom'])
+                ),
+                (
+                    'MT19937',
+                    dados['chavesNumpy'],
+                    int(dados['posicaoNumpy']),
+                    int(dados['gaussNumpy'][0]),
+                    float(dados['gaussNumpy'][1])
+                )
+            ),
+        }
     
-    filhos = []
-    
-    for i in range(numFilhos):
-        posicaoPai = random.randint(0, len(pais) - 1)
+    return populacao, estado
+
+# -------------------- MOTOR DO ALGORITMO --------------------
+class AlgoritmoGenetico:
+    """
+    Ponto de entrada do algoritmo: guarda os parâmetros e resolve quantas instâncias forem necessárias
         
-        filhoGerado = mutarPai(pais[posicaoPai], numFazendas, distanciasFazendas, coberturaAntena)
+    parâmetros:
+        coberturaAntena: int - a distancia coberta pela antena (km)
+        tamanhoPopulacao: int - quantidade de indivíduos da população
+        numPais: int - quantidade de pais selecionados no torneio
+        numFilhosCrossover: int - número de filhos gerados por crossover
+        numFilhosMutacao: int - número de filhos gerados por mutação
+        maximaVezesManteveAptidao: int - gerações (ou épocas, com ilhas) sem melhora antes de parar
+        tamanhoCache: int - tamanho do cache de aptidão
+        numProcessos: int - processos usados na geração dos filhos (1 = sequencial)
+        tamanhoLote: int - quantidade máxima de filhos por tarefa paralela
+        numIlhas: int - quantidade de ilhas (1 = população única)
+        geracoesPorEpoca: int - gerações entre duas migrações
+        numMigrantes: int - indivíduos que migram de cada ilha por época
+        semente: int - semente dos geradores aleatórios (None para não reprodutível)
+        telemetria: Telemetria - grava uma linha JSON por geração (opcional; ignorada no modelo de ilhas)
+        tempoMaximo: float - orçamento de tempo em segundos, verificado também a cada indivíduo gerado (None = sem limite)
+        maximoAvaliacoes: int - orçamento de indivíduos avaliados, sem contar acertos do cache; limita também o
+            tamanho da população inicial e os filhos de cada geração (None = sem limite)
+        aptidaoAlvo: float - para assim que a melhor aptidão alcançar este valor (None = sem alvo)
+        arquivoCheckpoint: str - arquivo .npz onde a população é gravada periodicamente (None = sem checkpoint)
+        intervaloCheckpoint: int - gerações entre dois checkpoints
         
-        filhos.append(filhoGerado)
+    Os orçamentos e os checkpoints valem apenas para a população única (numIlhas = 1).
+    """
+    # Intervalo mínimo (s) entre duas consultas a orcamentoEsgotado dentro de uma geração
+    intervaloVerificacao = 0.01
+
+    def __init__(self, coberturaAntena=10, tamanhoPopulacao=1000, numPais=100, numFilhosCrossover=600,
+                 numFilhosMutacao=300, maximaVezesManteveAptidao=10, tamanhoCache=100000, numProcessos=1,
+                 tamanhoLote=50, numIlhas=1, geracoesPorEpoca=5, numMigrantes=10, semente=None, telemetria=None,
+                 tempoMaximo=None, maximoAvaliacoes=None, aptidaoAlvo=None, arquivoCheckpoint=None,
+                 intervaloCheckpoint=10):
+        self.coberturaAntena = coberturaAntena
+        self.tamanhoPopulacao = tamanhoPopulacao
+        self.numPais = numPais
+        self.numFilhosCrossover = numFilhosCrossover
+        self.numFilhosMutacao = numFilhosMutacao
+        self.maximaVezesManteveAptidao = maximaVezesManteveAptidao
+        self.tamanhoCache = tamanhoCache
+        self.numProcessos = numProcessos
+        self.tamanhoLote = tamanhoLote
+        self.numIlhas = numIlhas
+        self.geracoesPorEpoca = geracoesPorEpoca
+        self.numMigrantes = numMigrantes
+        self.semente = semente
+        self.telemetria = telemetria
+        self.tempoMaximo = tempoMaximo
+        self.maximoAvaliacoes = maximoAvaliacoes
+        self.aptidaoAlvo = aptidaoAlvo
+        self.arquivoCheckpoint = arquivoCheckpoint
+        self.intervaloCheckpoint = intervaloCheckpoint
         
-    return filhos
+        if intervaloCheckpoint < 1:
+            raise ValueError('intervaloCheckpoint deve ser pelo menos 1, recebido {}'.format(intervaloCheckpoint))
+        self.cache = None
+        self.populacaoFinal = None
 
-# -------------------- CÓDIGO PRINCIPAL --------------------
+    def resolver(self, distanciasFazendas):
+        """
+        Executa o algoritmo genético sobre uma instância
+            
+        parâmetros:
+            distanciasFazendas: int[][] - matriz com a distância entre cada fazenda (km); lista, array ou memmap
+            
+        saída:
+            float - melhor aptidão encontrada
+            int[] - melhor solução encontrada
+        """
+        indice = IndiceCobertura(distanciasFazendas, self.coberturaAntena)
+        return self.resolverIndice(indice)
+
+    def resolverCoordenadas(self, coordenadas):
+        """
+        Executa o algoritmo genético sobre uma instância descrita pelas coordenadas das fazendas,
+        sem construir a matriz de distâncias
+            
+        parâmetros:
+            coordenadas: float[][] - posição (x, y) de cada fazenda (km)
+            
+        saída:
+            float - melhor aptidão encontrada
+            int[] - melhor solução encontrada
+        """
+        indice = IndiceCobertura.deCoordenadas(coordenadas, self.coberturaAntena)
+        return self.resolverIndice(indice)
+
+    def varrerRaios(self, raios, distanciasFazendas=None, coordenadas=None):
+        """
+        Resolve a mesma instância para vários raios de cobertura em um único processo.
+        Os vizinhos de cada fazenda são ordenados por distância uma única vez (IndiceVizinhosOrdenados),
+        e a população inicial de cada raio parte da população final do raio anterior.
+            
+        parâmetros:
+            raios: float[] - raios de cobertura (km), resolvidos na ordem recebida
+            distanciasFazendas: int[][] - matriz com a distância entre cada fazenda (km)
+            coordenadas: float[][] - posição (x, y) de cada fazenda (km), alternativa à matriz
+            
+        saída:
+            (float, float, int[])[] - raio, melhor aptidão e melhor solução de cada raio
+        """
+        if coordenadas is not None:
+            indiceOrdenado = IndiceVizinhosOrdenados.deCoordenadas(coordenadas, max(raios))
+        else:
+            indiceOrdenado = IndiceVizinhosOrdenados.deDistancias(distanciasFazendas, max(raios))
+        
+        resultados = []
+        populacao = None
+        
+        for raio in raios:
+            melhorAptidao, melhorSolucao = self.resolverIndice(indiceOrdenado.indiceParaRaio(raio), populacao)
+            populacao = self.populacaoFinal
+            resultados.append((raio, melhorAptidao, melhorSolucao))
+        
+        return resultados
+
+    def resolverIndice(self, indice, populacaoInicial=None, checkpoint=None):
+        """
+        Executa o algoritmo genético a partir de um índice de cobertura já construído.
+        A população final fica em self.populacaoFinal (None no modelo de ilhas).
+            
+        parâmetros:
+            indice: IndiceCobertura - índice de cobertura da instância
+            populacaoInicial: int[] - população a reaproveitar (ver adaptarPopulacao); None para aleatória
+            checkpoint: str - checkpoint de onde a execução é retomada (ver salvarCheckpoint)
+            
+        saída:
+            float - melhor aptidão encontrada
+            int[] - melhor solução encontrada
+        """
+        for melhorAptidao, melhorSolucao, _, _ in self.melhorias(indice, populacaoInicial, checkpoint):
+            pass
+        
+        return melhorAptidao, melhorSolucao
+
+    def orcamentoEsgotado(self, tempoDecorrido, avaliacoes, melhorAptidao):
+        """
+        Testa os critérios de parada além da paciência: tempo, avaliações e aptidão alvo
+        """
+        if self.tempoMaximo is not None and tempoDecorrido >= self.tempoMaximo:
+            return True
+        if self.maximoAvaliacoes is not None and avaliacoes >= self.maximoAvaliacoes:
+            return True
+        return self.aptidaoAlvo is not None and melhorAptidao >= self.aptidaoAlvo
+
+    def melhorias(self, indice, populacaoInicial=None, checkpoint=None):
+        """
+        Versão "anytime" de resolverIndice: gerador que devolve a melhor solução a cada vez que ela melhora,
+        começando pela melhor da população inicial. Quem consome pode parar a qualquer momento ficando com
+        a última tupla recebida; a população do momento continua disponível em self.populacaoFinal.
+        No modelo de ilhas só há uma tupla, com o resultado final.
+            
+        parâmetros:
+            indice: IndiceCobertura - índice de cobertura da instância
+            populacaoInicial: int[] - população a reaproveitar (ver adaptarPopulacao); None para aleatória
+            checkpoint: str - checkpoint de onde a execução é retomada (ver salvarCheckpoint); a população e os
+                geradores aleatórios voltam exatamente como estavam, então, com população única e sequencial,
+                a execução retomada segue a mesma sequência da interrompida
+            
+        saída (a cada melhoria):
+            float - melhor aptidão encontrada
+            int[] - melhor solução encontrada
+            int - geração em que foi encontrada
+            float - segundos desde o início da execução (somando as execuções anteriores ao checkpoint)
+        """
+        inicio = time.perf_counter()
+        
+        if self.semente is not None and checkpoint is None:
+            random.seed(self.semente)
+            np.random.seed(self.semente)
+        
+        self.cache = CacheAptidao(self.tamanhoCache)
+        self.populacaoFinal = None
+        
+        if self.numIlhas > 1:
+            parametrosIlha = {
+                'tamanhoPopulacao': self.tamanhoPopulacao,
+                'numPais': self.numPais,
+                'numFilhosCrossover': self.numFilhosCrossover,
+                'numFilhosMutacao': self.numFilhosMutacao,
+                'tamanhoCache': self.tamanhoCache,
+                'geracoesPorEpoca': self.geracoesPorEpoca,
+                'numMigrantes': self.numMigrantes,
+            }
+            melhorAptidao, melhorSolucao = executarIlhas(indice, self.numIlhas, parametrosIlha, self.maximaVezesManteveAptidao, self.semente)
+            yield melhorAptidao, melhorSolucao, None, time.perf_counter() - inicio
+            return
+        
+        estado = {'geracao': 0, 'vezesManteveAptidao': 0, 'tempoDecorrido': 0.0}
+        if checkpoint is not None:
+            populacaoInicial, estado = carregarCheckpoint(checkpoint)
+            
+            if estado['numFazendas'] != indice.numFazendas:
+                raise ValueError('O checkpoint {} tem {} fazendas, a instância tem {}'.format(checkpoint, estado['numFazendas'], indice.numFazendas))
+            
+            estadoRandom, estadoNumpy = estado['estadoAleatorio']
+            random.setstate(estadoRandom)
+            np.random.set_state(estadoNumpy)
+        
+        avaliacoesInicio = contadores['avaliacoes']
+        tempoAnterior = estado['tempoDecorrido']
+        
+        def tempoDecorrido():
+            return tempoAnterior + time.perf_counter() - inicio
+        
+        def avaliacoesFeitas():
+            return contadores['avaliacoes'] - avaliacoesInicio
+        
+        def avaliacoesRestantes():
+            if self.maximoAvaliacoes is None:
+                return None
+            return max(self.maximoAvaliacoes - avaliacoesFeitas(), 0)
+        
+        # Consultada antes de cada indivíduo gerado, para que o prazo (e, no serviço, o cancelamento) valha
+        # também no meio da população inicial e de uma geração; os critérios são testados no máximo a cada 10 ms
+        ultimaVerificacao = -np.inf
+        
+        def interromper():
+            nonlocal ultimaVerificacao
+            agora = time.perf_counter()
+            
+            if agora - ultimaVerificacao < self.intervaloVerificacao:
+                return False
+            
+            ultimaVerificacao = agora
+            return self.orcamentoEsgotado(tempoAnterior + agora - inicio, avaliacoesFeitas(), melhorAptidao)
+        
+        gerador = None
+        if self.numProcessos > 1:
+            gerador = GeradorParalelo(indice, self.numProcessos, self.tamanhoLote, self.semente)
+        
+        telemetria = self.telemetria
+        fase = telemetria.fase if telemetria is not None else lambda nome: semMedicao
+        
+        geracao = estado['geracao']
+        populacao = None
+        melhorAptidao = -np.inf
+        melhorSolucao = None
+        geracaoGravada = None
+        estadoAleatorio = None
+        
+        def gravarCheckpoint():
+            salvarCheckpoint(self.arquivoCheckpoint, populacao, indice.numFazendas, {
+                'geracao': geracao,
+                'melhorAptidao': melhorAptidao,
+                'melhorSolucao': melhorSolucao,
+                'vezesManteveAptidao': vezesManteveAptidao,
+                'tempoDecorrido': tempoDecorrido(),
+                'estadoAleatorio': estadoAleatorio,
+            })
+        
+        try:
+            if telemetria is not None:
+                telemetria.iniciarGeracao(geracao)
+            
+            # Gerando a população inicial
+            # Com orçamento de avaliações, a população inicial não passa dele (mas tem ao menos um indivíduo)
+            tamanhoInicial = self.tamanhoPopulacao
+            if self.maximoAvaliacoes is not None:
+                tamanhoInicial = max(min(tamanhoInicial, self.maximoAvaliacoes), 1)
+            
+            with fase('inicializacao'):
+                if checkpoint is not None:
+                    populacao = populacaoInicial
+                elif populacaoInicial is None:
+                    populacao = [gerarSolucaoAleatoria(indice)]
+                    while len(populacao) < tamanhoInicial and not interromper():
+                        populacao.append(gerarSolucaoAleatoria(indice))
+                else:
+                    populacao = adaptarPopulacao(populacaoInicial, indice, tamanhoInicial, interromper)
+            
+            with fase('avaliacao'):
+                aptidoes, _ = avaliarPopulacao(populacao, indice, self.cache)
+            
+            vezesManteveAptidao = estado['vezesManteveAptidao']
+            posicaoMelhor = np.argmax(aptidoes)
+            melhorAptidao = aptidoes[posicaoMelhor]
+            
+            if checkpoint is not None and estado['melhorAptidao'] >= melhorAptidao:
+                melhorAptidao = estado['melhorAptidao']
+                melhorSolucao = estado['melhorSolucao']
+            else:
+                melhorSolucao = antenasDe(populacao[posicaoMelhor])
+            
+            # O checkpoint guarda os geradores como estavam ao fim da última geração completa
+            if self.arquivoCheckpoint is not None:
+                estadoAleatorio = capturarEstadoAleatorio()
+            
+            if telemetria is not None:
+                telemetria.registrarGeracao(geracao, aptidoes, melhorAptidao, melhorSolucao, vezesManteveAptidao)
+            
+            yield float(melhorAptidao), melhorSolucao, geracao, tempoDecorrido()
+            
+            # Gerando demais populações
+            while vezesManteveAptidao < self.maximaVezesManteveAptidao and not self.orcamentoEsgotado(
+                    tempoDecorrido(), contadores['avaliacoes'] - avaliacoesInicio, melhorAptidao):
+                if telemetria is not None:
+                    telemetria.iniciarGeracao(geracao + 1)
+                
+                populacao, aptidoes = executarGeracao(
+                    populacao,
+                    aptidoes,
+                    indice,
+                    self.numPais,
+                    self.numFilhosCrossover,
+                    self.numFilhosMutacao,
+                    self.cache,
+                    gerador,
+                    telemetria,
+                    self.tamanhoPopulacao,
+                    interromper,
+                    avaliacoesRestantes()
+                )
+                geracao += 1
+                vezesManteveAptidao += 1
+                
+                if self.arquivoCheckpoint is not None:
+                    estadoAleatorio = capturarEstadoAleatorio()
+                
+                posicaoMelhor = np.argmax(aptidoes)
+                melhorou = aptidoes[posicaoMelhor] > melhorAptidao
+                
+                if melhorou:
+                    melhorAptidao = aptidoes[posicaoMelhor]
+                    melhorSolucao = antenasDe(populacao[posicaoMelhor])
+                    vezesManteveAptidao = 0
+                
+                if telemetria is not None:
+                    telemetria.registrarGeracao(geracao, aptidoes, melhorAptidao, melhorSolucao, vezesManteveAptidao)
+                
+                if self.arquivoCheckpoint is not None and geracao % self.intervaloCheckpoint == 0:
+                    gravarCheckpoint()
+                    geracaoGravada = geracao
+                
+                if melhorou:
+                    yield float(melhorAptidao), melhorSolucao, geracao, tempoDecorrido()
+        finally:
+            if gerador is not None:
+                gerador.fechar()
+            
+            # Também grava ao terminar ou ser interrompido (Ctrl+C, ou quem consome o gerador desistiu dele)
+            if self.arquivoCheckpoint is not None and melhorSolucao is not None and geracaoGravada != geracao:
+                gravarCheckpoint()
+            
+            self.populacaoFinal = populacao
+
+# -------------------- INSTÂNCIA DE EXEMPLO --------------------
+# Usada pela linha de comando quando nenhum arquivo de instância é informado
 distanciasFazendas = [
     [ 0.0,  3.6,  16.5,  28.4,  14.8,  29.1,  25.3,  25.6,  25.1,  22.5,  23.0,  14.6,  17.0,  19.2,  25.6,  25.8,  29.1,  37.5,  27.0,  33.1,  39.8,  41.9,  33.2,  36.2,  37.6,  35.7,  34.9,  36.8,  35.4,  36.3,  38.1,  42.0,  43.4,  43.1,  40.3,  42.4,  47.5,  46.5,  41.6,  50.5],
     [3.6,  0.0,  18.0,  30.1,  11.7,  30.4,  26.5,  26.7,  26.0,  22.8,  19.7,  12.5,  13.4,  16.0,  22.0,  24.8,  28.3,  36.9,  24.0,  31.6,  38.9,  41.0,  29.8,  32.7,  35.8,  33.6,  31.6,  33.2,  32.8,  33.7,  34.7,  38.5,  41.7,  41.1,  37.1,  38.9,  46.0,  44.9,  39.1,  49.2],
@@ -302,63 +1968,113 @@ distanciasFazendas = [
     [50.5,  49.2,  39.8,  37.0,  53.9,  34.0,  34.2,  33.2,  32.4,  31.3,  55.2,  36.9,  45.0,  38.6,  49.2,  24.7,  21.9,  15.1,  32.6,  17.7,  11.4,  10.0,  38.3,  43.9,  14.4,  18.8,  36.9,  42.8,  24.0,  23.8,  37.3,  46.2,  9.5,  12.2,  33.1,  42.0,  4.1,  6.1,  21.0,  0.0]
 ]
 
-numFazendas = len(distanciasFazendas)
-tamanhoPopulacao = 1000
-coberturaAntena = 10
-
-populacao = []
-numPais = 100
-numFilhosCrossover = 600
-numFilhosMutacao = 300
-
-melhorAptidao = 0
-melhorSolucao = None
-
-vezesManteveAptidao = 0
-maximaVezesManteveAptidao = 10
-
-# Gerando a população inicial
-for _ in range(tamanhoPopulacao):
-    solucao = []
-    fazendasCobertas = 0
+# -------------------- CÓDIGO PRINCIPAL --------------------
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(description='Algoritmo genético para posicionamento de antenas em fazendas')
+    parser.add_argument('instancia', nargs='?', help='matriz de distâncias (.npy, .bin/.f32 ou .csv); sem arquivo usa a instância de exemplo')
+    parser.add_argument('--coordenadas', action='store_true', help='o arquivo contém coordenadas (x, y) das fazendas (.npy ou .csv)')
+    parser.add_argument('--cobertura', type=float, default=10, help='distância coberta pela antena (km)')
+    parser.add_argument('--raios', type=float, nargs='+', help='resolve vários raios em sequência, reaproveitando a população (substitui --cobertura)')
+    parser.add_argument('--populacao', type=int, default=1000, help='tamanho da população')
+    parser.add_argument('--pais', type=int, default=100, help='pais selecionados no torneio')
+    parser.add_argument('--filhos-crossover', type=int, default=600, help='filhos gerados por crossover')
+    parser.add_argument('--filhos-mutacao', type=int, default=300, help='filhos gerados por mutação')
+    parser.add_argument('--paciencia', type=int, default=10, help='gerações (ou épocas, com ilhas) sem melhora antes de parar')
+    parser.add_argument('--cache', type=int, default=100000, help='tamanho do cache de aptidão')
+    parser.add_argument('--processos', type=int, default=1, help='processos usados na geração dos filhos')
+    parser.add_argument('--lote', type=int, default=50, help='filhos por tarefa paralela')
+    parser.add_argument('--ilhas', type=int, default=1, help='quantidade de ilhas')
+    parser.add_argument('--geracoes-epoca', type=int, default=5, help='gerações entre migrações')
+    parser.add_argument('--migrantes', type=int, default=10, help='indivíduos que migram por época')
+    parser.add_argument('--semente', type=int, default=None, help='semente dos geradores aleatórios')
+    parser.add_argument('--tempo-maximo', type=float, help='orçamento de tempo em segundos')
+    parser.add_argument('--max-avaliacoes', type=int, help='orçamento de indivíduos avaliados (acertos do cache não contam)')
+    parser.add_argument('--aptidao-alvo', type=float, help='para ao alcançar esta aptidão')
+    parser.add_argument('--progresso', action='store_true', help='mostra cada nova melhor solução assim que é encontrada')
+    parser.add_argument('--checkpoint', help='arquivo .npz onde a população é gravada periodicamente')
+    parser.add_argument('--intervalo-checkpoint', type=int, default=10, help='gerações entre checkpoints')
+    parser.add_argument('--retomar', help='checkpoint de onde a execução é retomada')
+    parser.add_argument('--telemetria', help='arquivo .jsonl com uma linha por geração ("-" para stderr)')
+    parser.add_argument('--perfil', help='arquivo .prof com o cProfile das gerações de --geracoes-perfil')
+    parser.add_argument('--geracoes-perfil', default='0:1', help='intervalo início:fim (exclusivo) das gerações perfiladas')
+    argumentos = parser.parse_args(argumentos)
     
-    while(fazendasCobertas < numFazendas):
-        antenasDisponiveis = set(range(numFazendas)) - set(solucao)
-        fazenda = random.choice(list(antenasDisponiveis))
-                
-        coberturaAtual = calculaCobertura(solucao + [fazenda], numFazendas, distanciasFazendas, coberturaAntena)
-        
-        if coberturaAtual > fazendasCobertas:
-            solucao.append(fazenda)
-            fazendasCobertas = coberturaAtual
-            
-    aptidaoAtual = calculaAptidao(solucao, distanciasFazendas, numFazendas, coberturaAntena)
+    if argumentos.retomar and argumentos.raios:
+        parser.error('--retomar não pode ser usado com --raios')
     
-    if aptidaoAtual > melhorAptidao:
-        melhorAptidao = aptidaoAtual
-        melhorSolucao = solucao[:]
-            
-    populacao.append(solucao)
-            
-# Gerando demais populações
-while vezesManteveAptidao < maximaVezesManteveAptidao:
-    vezesManteveAptidao += 1
-    # Torneio
-    paisSelecionados = selecionarPais(populacao, numPais, distanciasFazendas, numFazendas, coberturaAntena)
+    telemetria = None
+    perfilador = None
     
-    filhosPorCrossover = gerarFilhosPorCrossover(paisSelecionados, numFilhosCrossover, numFazendas, distanciasFazendas, coberturaAntena)
+    if argumentos.telemetria or argumentos.perfil:
+        if argumentos.telemetria == '-':
+            arquivoTelemetria = sys.stderr
+        elif argumentos.telemetria:
+            arquivoTelemetria = open(argumentos.telemetria, 'w')
+        else:
+            arquivoTelemetria = open(os.devnull, 'w')
+        
+        perfilador = cProfile.Profile() if argumentos.perfil else None
+        geracoesPerfil = tuple(int(geracao) for geracao in argumentos.geracoes_perfil.split(':'))
+        telemetria = Telemetria(arquivoTelemetria, perfilador, geracoesPerfil)
     
-    filhosPorMutacao = gerarFilhosPorMutacao(paisSelecionados, numFilhosMutacao, numFazendas, distanciasFazendas, coberturaAntena)
+    # A telemetria e o perfil são gravados mesmo se a execução falhar ou for interrompida
+    try:
+        algoritmo = AlgoritmoGenetico(
+            coberturaAntena=argumentos.cobertura,
+            tamanhoPopulacao=argumentos.populacao,
+            numPais=argumentos.pais,
+            numFilhosCrossover=argumentos.filhos_crossover,
+            numFilhosMutacao=argumentos.filhos_mutacao,
+            maximaVezesManteveAptidao=argumentos.paciencia,
+            tamanhoCache=argumentos.cache,
+            numProcessos=argumentos.processos,
+            tamanhoLote=argumentos.lote,
+            numIlhas=argumentos.ilhas,
+            geracoesPorEpoca=argumentos.geracoes_epoca,
+            numMigrantes=argumentos.migrantes,
+            semente=argumentos.semente,
+            telemetria=telemetria,
+            tempoMaximo=argumentos.tempo_maximo,
+            maximoAvaliacoes=argumentos.max_avaliacoes,
+            aptidaoAlvo=argumentos.aptidao_alvo,
+            arquivoCheckpoint=argumentos.checkpoint,
+            intervaloCheckpoint=argumentos.intervalo_checkpoint
+        )
+        
+        if argumentos.raios:
+            if argumentos.coordenadas:
+                resultados = algoritmo.varrerRaios(argumentos.raios, coordenadas=carregarCoordenadas(argumentos.instancia))
+            else:
+                distancias = carregarDistancias(argumentos.instancia) if argumentos.instancia else distanciasFazendas
+                resultados = algoritmo.varrerRaios(argumentos.raios, distanciasFazendas=distancias)
+        else:
+            if argumentos.coordenadas:
+                indice = IndiceCobertura.deCoordenadas(carregarCoordenadas(argumentos.instancia), argumentos.cobertura)
+            else:
+                distancias = carregarDistancias(argumentos.instancia) if argumentos.instancia else distanciasFazendas
+                indice = IndiceCobertura(distancias, argumentos.cobertura)
+            
+            for melhorAptidao, melhorSolucao, geracao, tempoDecorrido in algoritmo.melhorias(indice, checkpoint=argumentos.retomar):
+                if argumentos.progresso:
+                    print('Geração: ', geracao, 'Tempo: ', '{:.2f}s'.format(tempoDecorrido), 'Aptidão: ', melhorAptidao, 'Antenas: ', len(melhorSolucao))
+    finally:
+        if perfilador is not None:
+            perfilador.disable()
+            perfilador.dump_stats(argumentos.perfil)
+        
+        if telemetria is not None and telemetria.arquivo is not sys.stderr:
+            telemetria.arquivo.close()
     
-    populacao = paisSelecionados + filhosPorCrossover + filhosPorMutacao
+    if argumentos.raios:
+        for raio, melhorAptidao, melhorSolucao in resultados:
+            print('Raio: ', raio, 'Melhor aptidão: ', melhorAptidao, 'Antenas: ', len(melhorSolucao))
+            print('Solução: ', melhorSolucao)
+        return
     
-    for solucao in populacao:
-        aptidaoAtual = calculaAptidao(solucao, distanciasFazendas, numFazendas, coberturaAntena)
-        
-        if aptidaoAtual > melhorAptidao:
-            melhorAptidao = aptidaoAtual
-            melhorSolucao = solucao[:]
-            vezesManteveAptidao = 0
+    print('Melhor aptidão: ', melhorAptidao)
+    print('Solução: ', melhorSolucao)
+    if argumentos.ilhas == 1:
+        print('Cache de aptidão: ', algoritmo.cache.acertos, 'acertos,', algoritmo.cache.falhas, 'falhas', '({:.1%})'.format(algoritmo.cache.taxaAcertos()))
 
-print('Melhor aptidão: ', melhorAptidao)
-print('Solução: ', melhorSolucao)
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,595 @@
+# -*- coding: utf-8 -*-
+"""
+PLMC - Serviço local do Algoritmo Genético
+
+Processo de longa duração para as ferramentas que chamam o algoritmo várias vezes: a instância é lida
+uma única vez e o índice de cobertura de cada raio fica em cache (LRU), indexado pelo hash da instância,
+em memória compartilhada que os processos do pool anexam uma única vez.
+Os trabalhos rodam em um pool limitado de processos; os que não cabem esperam na fila, requisições
+idênticas em andamento compartilham o mesmo trabalho e qualquer uma pode ser cancelada.
+
+Protocolo: uma requisição JSON por linha, uma resposta JSON por linha (com o mesmo "id").
+Respostas de requisições diferentes da mesma conexão podem chegar fora de ordem.
+    {"id": 1, "acao": "resolver", "instancia": {...}, "cobertura": 10, "parametros": {"tamanhoPopulacao": 500}}
+        instancia: {"distancias": [[...]]} ou {"coordenadas": [[x, y], ...]} ou {"arquivo": "instancia.npy"}
+                   (com "coordenadas": true quando o arquivo contém coordenadas)
+        resposta: {"id": 1, "melhorAptidao": 6.7, "melhorSolucao": [...], "tempo": 1.2}
+    {"id": 2, "acao": "cancelar", "alvo": 1}
+    {"id": 3, "acao": "estado"}
+
+Uso:
+    python servico.py --socket /tmp/plmc.sock --processos 4
+    python servico.py --porta 8765
+
+    ou, de outra ferramenta:
+    from servico import enviarRequisicao
+    resposta = enviarRequisicao({'acao': 'resolver', 'instancia': {'arquivo': 'instancia.npy'}, 'cobertura': 10}, socketUnix='/tmp/plmc.sock')
+"""
+
+import argparse
+import asyncio
+import hashlib
+import itertools
+import json
+import multiprocessing
+import os
+import socket
+import time
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from implementacao import (
+    AlgoritmoGenetico,
+    IndiceVizinhosOrdenados,
+    carregarCoordenadas,
+    carregarDistancias,
+    compartilharIndice,
+    indiceCompartilhado,
+)
+
+# Parâmetros de AlgoritmoGenetico aceitos nas requisições; processos e ilhas ficam a cargo do pool do serviço
+parametrosPermitidos = (
+    'tamanhoPopulacao',
+    'numPais',
+    'numFilhosCrossover',
+    'numFilhosMutacao',
+    'maximaVezesManteveAptidao',
+    'tamanhoCache',
+    'semente',
+    'tempoMaximo',
+    'maximoAvaliacoes',
+    'aptidaoAlvo',
+)
+
+# -------------------- CACHES --------------------
+class CacheLRU:
+    """
+    Cache LRU genérico (mesma política de CacheAptidao) para as estruturas derivadas de cada instância
+
+    parâmetros:
+        tamanhoMaximo: int - quantidade máxima de entradas mantidas
+
+    atributos:
+        acertos: int - consultas atendidas pelo cache
+        falhas: int - consultas que precisaram recalcular
+    """
+    def __init__(self, tamanhoMaximo):
+        self.tamanhoMaximo = tamanhoMaximo
+        self.entradas = OrderedDict()
+        self.acertos = 0
+        self.falhas = 0
+
+    def buscar(self, chave):
+        resultado = self.entradas.get(chave)
+
+        if resultado is None:
+            self.falhas += 1
+        else:
+            self.acertos += 1
+            self.entradas.move_to_end(chave)
+
+        return resultado
+
+    def guardar(self, chave, resultado):
+        self.entradas[chave] = resultado
+        self.entradas.move_to_end(chave)
+
+        if len(self.entradas) > self.tamanhoMaximo:
+            self.entradas.popitem(last=False)
+
+    def resumo(self):
+        return {'entradas': len(self.entradas), 'acertos': self.acertos, 'falhas': self.falhas}
+
+def hashInstancia(tipo, dados, tamanhoBloco=1024):
+    """
+    Hash do conteúdo da instância, lido por blocos de linhas (aceita memmap)
+
+    parâmetros:
+        tipo: str - 'distancias' ou 'coordenadas'
+        dados: float[][] - matriz de distâncias ou coordenadas das fazendas
+        tamanhoBloco: int - quantidade de linhas lidas por vez
+
+    saída:
+        str - hash hexadecimal (sha1)
+    """
+    resumo = hashlib.sha1('{}:{}'.format(tipo, dados.shape).encode())
+
+    for inicio in range(0, len(dados), tamanhoBloco):
+        resumo.update(np.ascontiguousarray(dados[inicio:inicio + tamanhoBloco], dtype=np.float64).tobytes())
+
+    return resumo.hexdigest()
+
+def lerInstancia(instancia):
+    """
+    Converte a instância de uma requisição em (tipo, dados)
+
+    parâmetros:
+        instancia: dict - {"distancias": ...}, {"coordenadas": ...} ou {"arquivo": ..., "coordenadas": bool}
+
+    saída:
+        str - 'distancias' ou 'coordenadas'
+        float[][] - matriz de distâncias ou coordenadas das fazendas
+    """
+    if 'arquivo' in instancia:
+        if instancia.get('coordenadas'):
+            return 'coordenadas', carregarCoordenadas(instancia['arquivo'])
+        return 'distancias', carregarDistancias(instancia['arquivo'])
+
+    if 'coordenadas' in instancia:
+        coordenadas = np.asarray(instancia['coordenadas'], dtype=np.float64)
+
+        if coordenadas.ndim != 2 or coordenadas.shape[1] != 2:
+            raise ValueError('As coordenadas devem ter duas colunas (x, y), recebido {}'.format(coordenadas.shape))
+
+        return 'coordenadas', coordenadas
+
+    if 'distancias' in instancia:
+        distancias = np.asarray(instancia['distancias'], dtype=np.float64)
+
+        if distancias.ndim != 2 or distancias.shape[0] != distancias.shape[1]:
+            raise ValueError('A matriz de distâncias deve ser quadrada, recebido {}'.format(distancias.shape))
+
+        return 'distancias', distancias
+
+    raise ValueError('A instância deve ter "arquivo", "coordenadas" ou "distancias"')
+
+def removerMemoria(memoria):
+    memoria.close()
+    memoria.unlink()
+
+class BlocoIndice:
+    """
+    Índice de cobertura de um raio copiado para memória compartilhada (ver compartilharIndice): os processos
+    do pool o anexam pelo nome, sem que os vetores sejam enviados a cada trabalho. O bloco só é removido
+    quando nada mais referencia o objeto: nem o cache, nem uma requisição, nem um trabalho em execução.
+
+    parâmetros:
+        memoria: SharedMemory - bloco criado por compartilharIndice
+        formatoIndice: (int, int, bool) - formato do índice (ver compartilharIndice)
+    """
+    def __init__(self, memoria, formatoIndice):
+        self.nome = memoria.name
+        self.formatoIndice = formatoIndice
+        self.remover = weakref.finalize(self, removerMemoria, memoria)
+
+    @classmethod
+    def deVizinhos(cls, vizinhos, raio):
+        """
+        Monta o índice do raio a partir das listas de vizinhos ordenadas e o copia para um novo bloco
+        """
+        return cls(*compartilharIndice(vizinhos.indiceParaRaio(raio)))
+
+# -------------------- PROCESSOS TRABALHADORES --------------------
+# Índices já anexados neste processo trabalhador: (SharedMemory, IndiceCobertura) por (hash, raio).
+# O índice vem depois do bloco na tupla para ser liberado antes dele quando a entrada sai do cache.
+indicesProcesso = CacheLRU(4)
+
+class AlgoritmoInterrompivel(AlgoritmoGenetico):
+    """
+    AlgoritmoGenetico que também para quando o evento parar é sinalizado, inclusive no meio da população
+    inicial ou de uma geração (orcamentoEsgotado é consultado a cada indivíduo gerado, ver melhorias)
+
+    parâmetros:
+        parar: Event - evento de cancelamento (multiprocessing.Manager().Event())
+        demais parâmetros: os mesmos de AlgoritmoGenetico
+    """
+    def __init__(self, parar, **parametros):
+        super().__init__(**parametros)
+        self.parar = parar
+
+    def orcamentoEsgotado(self, tempoDecorrido, avaliacoes, melhorAptidao):
+        return self.parar.is_set() or super().orcamentoEsgotado(tempoDecorrido, avaliacoes, melhorAptidao)
+
+def executarTrabalho(chaveIndice, nomeMemoria, formatoIndice, parametros, parar):
+    """
+    Executa o algoritmo genético em um processo do pool
+
+    parâmetros:
+        chaveIndice: (str, float) - hash da instância e raio de cobertura
+        nomeMemoria: str - nome do bloco com o índice de cobertura (ver BlocoIndice); anexado só se o
+            processo ainda não tem o índice dessa chave
+        formatoIndice: (int, int, bool) - formato do índice (ver compartilharIndice)
+        parametros: dict - parâmetros de AlgoritmoGenetico
+        parar: Event - evento de cancelamento
+
+    saída:
+        float - melhor aptidão encontrada
+        int[] - melhor solução encontrada
+    """
+    anexado = indicesProcesso.buscar(chaveIndice)
+
+    if anexado is None:
+        anexado = indiceCompartilhado(nomeMemoria, formatoIndice)
+        indicesProcesso.guardar(chaveIndice, anexado)
+
+    _, indice = anexado
+    return AlgoritmoInterrompivel(parar, **parametros).resolverIndice(indice)
+
+# -------------------- SERVIÇO --------------------
+class Trabalho:
+    """
+    Um trabalho em andamento, compartilhado pelas requisições idênticas que chegaram enquanto ele executava
+
+    atributos:
+        tarefa: asyncio.Task - espera a vaga no pool e o resultado do processo
+        parar: Event - evento de cancelamento enviado ao processo
+        interessados: int - requisições que ainda aguardam o resultado
+    """
+    def __init__(self, tarefa, parar):
+        self.tarefa = tarefa
+        self.parar = parar
+        self.interessados = 0
+
+class ServicoSolver:
+    """
+    Recebe as requisições, mantém os caches por instância e distribui os trabalhos no pool de processos
+
+    parâmetros:
+        numProcessos: int - trabalhos executados ao mesmo tempo (os demais esperam na fila)
+        tamanhoCacheInstancias: int - arquivos de instância e listas de vizinhos mantidos em memória
+        tamanhoCacheIndices: int - índices de cobertura (instância, raio) mantidos em memória
+    """
+    def __init__(self, numProcessos, tamanhoCacheInstancias=8, tamanhoCacheIndices=32):
+        self.numProcessos = numProcessos
+        # spawn: o serviço já tem threads (run_in_executor) quando o pool cria os processos
+        self.executor = ProcessPoolExecutor(numProcessos, mp_context=multiprocessing.get_context('spawn'))
+        self.gerenciador = multiprocessing.Manager()
+        self.vagas = asyncio.Semaphore(numProcessos)
+
+        # arquivo (caminho, mtime, tamanho) -> (hash, tipo, dados)
+        self.arquivos = CacheLRU(tamanhoCacheInstancias)
+        # hash -> IndiceVizinhosOrdenados com o maior raio pedido até agora
+        self.vizinhos = CacheLRU(tamanhoCacheInstancias)
+        # (hash, raio) -> BlocoIndice
+        self.indices = CacheLRU(tamanhoCacheIndices)
+
+        # hash -> (raio, futuro) das listas de vizinhos sendo montadas
+        self.ordenando = {}
+        # (hash, raio) -> futuro do índice sendo montado
+        self.preparando = {}
+        self.emAndamento = {}
+        self.naFila = 0
+
+    async def emThread(self, funcao, *argumentos):
+        return await asyncio.get_running_loop().run_in_executor(None, funcao, *argumentos)
+
+    async def carregarInstancia(self, instancia):
+        """
+        Lê a instância da requisição; arquivos já lidos (mesmo caminho, mtime e tamanho) vêm do cache
+
+        saída:
+            str - hash da instância
+            str - 'distancias' ou 'coordenadas'
+            float[][] - matriz de distâncias ou coordenadas das fazendas
+        """
+        if 'arquivo' not in instancia:
+            tipo, dados = lerInstancia(instancia)
+            return await self.emThread(hashInstancia, tipo, dados), tipo, dados
+
+        caminho = os.path.realpath(instancia['arquivo'])
+        situacao = os.stat(caminho)
+        chave = (caminho, bool(instancia.get('coordenadas')), situacao.st_mtime_ns, situacao.st_size)
+        resultado = self.arquivos.buscar(chave)
+
+        if resultado is None:
+            tipo, dados = await self.emThread(lerInstancia, instancia)
+            resultado = (await self.emThread(hashInstancia, tipo, dados), tipo, dados)
+            self.arquivos.guardar(chave, resultado)
+
+        return resultado
+
+    async def prepararVizinhos(self, chaveInstancia, tipo, dados, raio):
+        """
+        Listas de vizinhos ordenadas da instância que atendem ao raio pedido. São refeitas apenas quando o raio
+        passa do maior raio já pedido para essa instância, e uma única vez mesmo que vários raios maiores
+        cheguem ao mesmo tempo. O cache é consultado e atualizado só no laço de eventos; a thread apenas
+        monta as listas.
+        """
+        vizinhos = self.vizinhos.buscar(chaveInstancia)
+
+        if vizinhos is not None and raio <= vizinhos.raioMaximo:
+            return vizinhos
+
+        emPreparo = self.ordenando.get(chaveInstancia)
+
+        if emPreparo is None or raio > emPreparo[0]:
+            if tipo == 'coordenadas':
+                montar = IndiceVizinhosOrdenados.deCoordenadas
+            else:
+                montar = IndiceVizinhosOrdenados.deDistancias
+            emPreparo = (raio, asyncio.ensure_future(self.emThread(montar, dados, raio)))
+            self.ordenando[chaveInstancia] = emPreparo
+
+        try:
+            vizinhos = await asyncio.shield(emPreparo[1])
+        finally:
+            if self.ordenando.get(chaveInstancia) is emPreparo and emPreparo[1].done():
+                del self.ordenando[chaveInstancia]
+
+        # Um raio menor que terminou depois não substitui listas que já atendem a um raio maior
+        atual = self.vizinhos.entradas.get(chaveInstancia)
+        if atual is None or vizinhos.raioMaximo > atual.raioMaximo:
+            self.vizinhos.guardar(chaveInstancia, vizinhos)
+
+        return vizinhos
+
+    async def montarIndice(self, chaveInstancia, tipo, dados, raio):
+        """
+        Índice de cobertura do raio pedido, a partir das listas de vizinhos ordenadas da instância,
+        já copiado para memória compartilhada
+        """
+        vizinhos = await self.prepararVizinhos(chaveInstancia, tipo, dados, raio)
+        return await self.emThread(BlocoIndice.deVizinhos, vizinhos, raio)
+
+    async def prepararIndice(self, chaveInstancia, tipo, dados, raio):
+        """
+        Índice de cobertura da instância para o raio, vindo do cache ou montado uma única vez
+        mesmo que várias requisições o peçam ao mesmo tempo.
+        """
+        chave = (chaveInstancia, raio)
+        bloco = self.indices.buscar(chave)
+
+        if bloco is not None:
+            return bloco
+
+        if chave not in self.preparando:
+            futuro = asyncio.ensure_future(self.montarIndice(chaveInstancia, tipo, dados, raio))
+            futuro.add_done_callback(lambda _: self.guardarIndice(chave, futuro))
+            self.preparando[chave] = futuro
+
+        try:
+            return await asyncio.shield(self.preparando[chave])
+        finally:
+            if chave in self.preparando and self.preparando[chave].done():
+                del self.preparando[chave]
+
+    def guardarIndice(self, chave, futuro):
+        # Guardado no cache mesmo que todas as requisições que esperavam pelo índice tenham sido canceladas
+        if not futuro.cancelled() and futuro.exception() is None:
+            self.indices.guardar(chave, futuro.result())
+
+    async def executar(self, chaveIndice, bloco, parametros, parar):
+        """
+        Espera uma vaga no pool e executa o trabalho. Se for cancelado depois de enviado ao pool, só termina
+        quando o processo termina: até lá a referência a bloco mantém o índice compartilhado (ver BlocoIndice).
+        """
+        self.naFila += 1
+        try:
+            await self.vagas.acquire()
+        finally:
+            self.naFila -= 1
+
+        try:
+            futuro = self.executor.submit(executarTrabalho, chaveIndice, bloco.nome, bloco.formatoIndice, parametros, parar)
+        except BaseException:
+            self.vagas.release()
+            raise
+
+        # A vaga só é liberada quando o processo termina: um trabalho cancelado continua executando
+        # até a próxima verificação de parar, e ainda ocupa o processo até lá
+        laco = asyncio.get_running_loop()
+        futuro.add_done_callback(lambda _: laco.call_soon_threadsafe(self.vagas.release))
+
+        inicio = time.perf_counter()
+        resultado = asyncio.wrap_future(futuro)
+        try:
+            melhorAptidao, melhorSolucao = await asyncio.shield(resultado)
+        except asyncio.CancelledError:
+            futuro.cancel()
+            await asyncio.wait([resultado])
+            raise
+        return {'melhorAptidao': melhorAptidao, 'melhorSolucao': melhorSolucao, 'tempo': time.perf_counter() - inicio}
+
+    async def resolver(self, requisicao):
+        """
+        Atende uma requisição "resolver"; requisições idênticas em andamento aguardam o mesmo trabalho
+        """
+        parametros = requisicao.get('parametros', {})
+        desconhecidos = set(parametros) - set(parametrosPermitidos)
+
+        if desconhecidos:
+            raise ValueError('Parâmetros não suportados: {}'.format(', '.join(sorted(desconhecidos))))
+
+        raio = float(requisicao.get('cobertura', 10))
+        chaveInstancia, tipo, dados = await self.carregarInstancia(requisicao['instancia'])
+        chaveTrabalho = json.dumps([chaveInstancia, raio, parametros], sort_keys=True)
+
+        trabalho = self.emAndamento.get(chaveTrabalho)
+        if trabalho is None:
+            bloco = await self.prepararIndice(chaveInstancia, tipo, dados, raio)
+            trabalho = self.emAndamento.get(chaveTrabalho)
+
+        if trabalho is None:
+            parar = self.gerenciador.Event()
+            tarefa = asyncio.ensure_future(self.executar((chaveInstancia, raio), bloco, dict(parametros, coberturaAntena=raio), parar))
+            trabalho = Trabalho(tarefa, parar)
+            self.emAndamento[chaveTrabalho] = trabalho
+            tarefa.add_done_callback(lambda _: self.descartarTrabalho(chaveTrabalho, trabalho))
+
+        trabalho.interessados += 1
+        try:
+            return await asyncio.shield(trabalho.tarefa)
+        except asyncio.CancelledError:
+            # Cancela o trabalho apenas quando ninguém mais aguarda por ele
+            trabalho.interessados -= 1
+            if trabalho.interessados == 0:
+                trabalho.parar.set()
+                trabalho.tarefa.cancel()
+                self.descartarTrabalho(chaveTrabalho, trabalho)
+            raise
+
+    def descartarTrabalho(self, chaveTrabalho, trabalho):
+        # Uma requisição idêntica pode já ter registrado um novo trabalho com a mesma chave
+        if self.emAndamento.get(chaveTrabalho) is trabalho:
+            del self.emAndamento[chaveTrabalho]
+
+    def estado(self):
+        return {
+            'processos': self.numProcessos,
+            'emAndamento': len(self.emAndamento),
+            'naFila': self.naFila,
+            'cacheArquivos': self.arquivos.resumo(),
+            'cacheVizinhos': self.vizinhos.resumo(),
+            'cacheIndices': self.indices.resumo(),
+        }
+
+    async def atenderConexao(self, leitor, escritor):
+        """
+        Lê as requisições de uma conexão, uma por linha, e atende cada uma em uma tarefa própria
+        """
+        requisicoes = {}
+        travaEscrita = asyncio.Lock()
+
+        async def responder(resposta):
+            async with travaEscrita:
+                escritor.write((json.dumps(resposta) + '\n').encode())
+                await escritor.drain()
+
+        async def atender(requisicao):
+            identificador = requisicao.get('id')
+            try:
+                resposta = await self.resolver(requisicao)
+            except asyncio.CancelledError:
+                resposta = {'cancelado': True}
+            except Exception as erro:
+                resposta = {'erro': '{}: {}'.format(type(erro).__name__, erro)}
+            finally:
+                requisicoes.pop(identificador, None)
+
+            try:
+                await responder(dict(resposta, id=identificador))
+            except ConnectionError:
+                pass
+
+        try:
+            while True:
+                linha = await leitor.readline()
+                if not linha:
+                    break
+
+                try:
+                    requisicao = json.loads(linha)
+                    acao = requisicao.get('acao', 'resolver')
+                except (ValueError, AttributeError):
+                    await responder({'id': None, 'erro': 'Requisição não é um objeto JSON'})
+                    continue
+
+                if acao == 'resolver':
+                    requisicoes[requisicao.get('id')] = asyncio.ensure_future(atender(requisicao))
+                elif acao == 'cancelar':
+                    tarefa = requisicoes.get(requisicao.get('alvo'))
+                    if tarefa is not None:
+                        tarefa.cancel()
+                    await responder({'id': requisicao.get('id'), 'cancelado': tarefa is not None})
+                elif acao == 'estado':
+                    await responder(dict(self.estado(), id=requisicao.get('id')))
+                else:
+                    await responder({'id': requisicao.get('id'), 'erro': 'Ação desconhecida: {}'.format(acao)})
+        except ConnectionError:
+            pass
+        finally:
+            # A conexão caiu: cancela o que ela ainda aguardava
+            for tarefa in list(requisicoes.values()):
+                tarefa.cancel()
+            escritor.close()
+
+    def fechar(self):
+        for trabalho in self.emAndamento.values():
+            trabalho.parar.set()
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        self.gerenciador.shutdown()
+
+        for bloco in self.indices.entradas.values():
+            bloco.remover()
+
+async def servir(servico, socketUnix=None, porta=None):
+    if porta is not None:
+        servidor = await asyncio.start_server(servico.atenderConexao, '127.0.0.1', porta, limit=2 ** 30)
+    else:
+        servidor = await asyncio.start_unix_server(servico.atenderConexao, socketUnix, limit=2 ** 30)
+
+    async with servidor:
+        await servidor.serve_forever()
+
+# -------------------- CLIENTE --------------------
+contadorRequisicoes = itertools.count(1)
+
+def enviarRequisicao(requisicao, socketUnix=None, porta=None):
+    """
+    Envia uma requisição ao serviço e espera a resposta (cliente síncrono para as ferramentas de planejamento)
+
+    parâmetros:
+        requisicao: dict - requisição (ver o protocolo no início do arquivo); recebe um "id" se não tiver
+        socketUnix: str - caminho do socket Unix do serviço
+        porta: int - porta TCP do serviço em 127.0.0.1 (alternativa ao socket Unix)
+
+    saída:
+        dict - resposta do serviço
+    """
+    requisicao = dict(requisicao)
+    requisicao.setdefault('id', next(contadorRequisicoes))
+
+    if porta is not None:
+        conexao = socket.create_connection(('127.0.0.1', porta))
+    else:
+        conexao = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        conexao.connect(socketUnix)
+
+    with conexao, conexao.makefile('rwb') as arquivo:
+        arquivo.write((json.dumps(requisicao) + '\n').encode())
+        arquivo.flush()
+
+        for linha in arquivo:
+            resposta = json.loads(linha)
+            if resposta.get('id') == requisicao['id']:
+                return resposta
+
+    raise ConnectionError('O serviço encerrou a conexão sem responder')
+
+# -------------------- CÓDIGO PRINCIPAL --------------------
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(description='Serviço local do algoritmo genético para posicionamento de antenas')
+    parser.add_argument('--socket', default='/tmp/plmc.sock', help='caminho do socket Unix')
+    parser.add_argument('--porta', type=int, help='escuta em 127.0.0.1 nesta porta em vez do socket Unix')
+    parser.add_argument('--processos', type=int, default=os.cpu_count(), help='trabalhos executados ao mesmo tempo')
+    parser.add_argument('--cache-instancias', type=int, default=8, help='instâncias (arquivos e vizinhos) mantidas em cache')
+    parser.add_argument('--cache-indices', type=int, default=32, help='índices de cobertura (instância, raio) mantidos em cache')
+    argumentos = parser.parse_args(argumentos)
+
+    if argumentos.porta is None and os.path.exists(argumentos.socket):
+        os.remove(argumentos.socket)
+
+    servico = ServicoSolver(argumentos.processos, argumentos.cache_instancias, argumentos.cache_indices)
+
+    try:
+        asyncio.run(servir(servico, argumentos.socket, argumentos.porta))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        servico.fechar()
+
+if __name__ == '__main__':
+    main()
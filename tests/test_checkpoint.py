@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+"""
+Checkpoints: gravação, leitura e retomada exata de uma execução interrompida
+"""
+
+import random
+
+import numpy as np
+
+from implementacao import (
+    AlgoritmoGenetico,
+    IndiceCobertura,
+    capturarEstadoAleatorio,
+    carregarCheckpoint,
+    distanciasFazendas,
+    salvarCheckpoint,
+)
+
+# População pequena para o teste rodar em poucos segundos
+parametros = {
+    'coberturaAntena': 10,
+    'tamanhoPopulacao': 200,
+    'numPais': 20,
+    'numFilhosCrossover': 120,
+    'numFilhosMutacao': 60,
+    'maximaVezesManteveAptidao': 5,
+    'semente': 3,
+}
+
+def test_carregar_checkpoint_restaura_geradores(tmp_path):
+    random.seed(7)
+    np.random.seed(7)
+    # Um valor gaussiano pendente em cada gerador, para que o estado guardado não seja o trivial
+    random.gauss(0, 1)
+    np.random.normal()
+    estadoAleatorio = capturarEstadoAleatorio()
+
+    esperadoRandom = [random.random() for _ in range(5)] + [random.gauss(0, 1)]
+    esperadoNumpy = np.random.normal(size=5)
+
+    caminho = str(tmp_path / 'checkpoint.npz')
+    salvarCheckpoint(caminho, [0b1011, 0b0110], 4, {
+        'geracao': 4,
+        'melhorAptidao': 2.5,
+        'melhorSolucao': [0, 1, 3],
+        'vezesManteveAptidao': 1,
+        'tempoDecorrido': 0.5,
+        'estadoAleatorio': estadoAleatorio,
+    })
+
+    # Avança os geradores para garantir que os valores abaixo venham do estado lido
+    random.seed(99)
+    np.random.seed(99)
+
+    populacao, estado = carregarCheckpoint(caminho)
+    estadoRandom, estadoNumpy = estado['estadoAleatorio']
+    random.setstate(estadoRandom)
+    np.random.set_state(estadoNumpy)
+
+    assert populacao == [0b1011, 0b0110]
+    assert estado['numFazendas'] == 4
+    assert estado['geracao'] == 4
+    assert estado['melhorSolucao'] == [0, 1, 3]
+    assert [random.random() for _ in range(5)] + [random.gauss(0, 1)] == esperadoRandom
+    assert np.array_equal(np.random.normal(size=5), esperadoNumpy)
+
+def test_retomada_segue_a_execucao_interrompida(tmp_path):
+    indice = IndiceCobertura(distanciasFazendas, parametros['coberturaAntena'])
+
+    completo = AlgoritmoGenetico(**parametros)
+    melhorAptidao, melhorSolucao = completo.resolverIndice(indice)
+
+    # Interrompe na primeira melhoria depois da geração 0; o checkpoint é gravado ao fechar o gerador
+    caminho = str(tmp_path / 'checkpoint.npz')
+    interrompido = AlgoritmoGenetico(arquivoCheckpoint=caminho, **parametros)
+    melhorias = interrompido.melhorias(indice)
+    for _, _, geracao, _ in melhorias:
+        if geracao > 0:
+            break
+    melhorias.close()
+
+    _, estado = carregarCheckpoint(caminho)
+    assert geracao > 0
+    assert estado['geracao'] == geracao
+
+    # Os geradores globais mudam entre a interrupção e a retomada (ex.: outro processo)
+    random.seed(99)
+    np.random.seed(99)
+
+    retomado = AlgoritmoGenetico(**parametros)
+    assert retomado.resolverIndice(indice, checkpoint=caminho) == (melhorAptidao, melhorSolucao)
+    assert retomado.populacaoFinal == completo.populacaoFinal
@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+"""
+Índices de cobertura: os caminhos esparsos (grade de coordenadas, vizinhos ordenados e avaliação pelas
+listas de adjacência) devem dar o mesmo resultado do índice montado a partir da matriz de distâncias
+"""
+
+import random
+
+import numpy as np
+import pytest
+
+from implementacao import (
+    IndiceCobertura,
+    IndiceVizinhosOrdenados,
+    avaliarLote,
+    avaliarLoteEsparso,
+    distanciasFazendas,
+    gerarSolucaoAleatoria,
+)
+
+def gerarCoordenadas(numFazendas, semente):
+    """
+    Fazendas espalhadas em um quadrado e também agrupadas, para exercitar células vazias e cheias da grade
+    """
+    gerador = np.random.default_rng(semente)
+    espalhadas = gerador.uniform(0, 100, size=(numFazendas // 2, 2))
+    centros = gerador.uniform(0, 100, size=(5, 2))
+    agrupadas = centros[gerador.integers(0, 5, numFazendas - numFazendas // 2)] + gerador.normal(0, 3, size=(numFazendas - numFazendas // 2, 2))
+
+    return np.concatenate([espalhadas, agrupadas])
+
+def matrizDistancias(coordenadas):
+    diferencas = coordenadas[:, None, :] - coordenadas[None, :, :]
+    return np.sqrt((diferencas ** 2).sum(axis=2))
+
+def verificarIguais(indice, esperado):
+    """
+    A ordem dentro de cada linha pode mudar (os vizinhos ordenados vêm por distância), o conjunto não
+    """
+    assert indice.numFazendas == esperado.numFazendas
+    assert np.array_equal(indice.ponteiros, esperado.ponteiros)
+    assert np.array_equal(indice.grau, esperado.grau)
+    assert all(np.array_equal(np.sort(a), np.sort(b)) for a, b in zip(indice.vizinhos, esperado.vizinhos))
+    assert all(np.array_equal(np.sort(a), np.sort(b)) for a, b in zip(indice.cobridores, esperado.cobridores))
+    assert np.array_equal(indice.matrizPesos, esperado.matrizPesos)
+
+@pytest.mark.parametrize('raio', [0.5, 5, 12.5, 40])
+def test_indice_de_coordenadas_igual_ao_denso(raio):
+    coordenadas = gerarCoordenadas(300, 1)
+    esperado = IndiceCobertura(matrizDistancias(coordenadas), raio)
+
+    verificarIguais(IndiceCobertura.deCoordenadas(coordenadas, raio), esperado)
+    # Blocos pequenos: a grade é percorrida em vários pedaços
+    verificarIguais(IndiceCobertura.deCoordenadas(coordenadas, raio, tamanhoBloco=7), esperado)
+
+@pytest.mark.parametrize('raio', [0.5, 5, 12.5, 40])
+def test_vizinhos_ordenados_iguais_ao_denso(raio):
+    coordenadas = gerarCoordenadas(300, 2)
+    distancias = matrizDistancias(coordenadas)
+    esperado = IndiceCobertura(distancias, raio)
+
+    verificarIguais(IndiceVizinhosOrdenados.deCoordenadas(coordenadas, 40).indiceParaRaio(raio), esperado)
+    verificarIguais(IndiceVizinhosOrdenados.deDistancias(distancias, 40, tamanhoBloco=64).indiceParaRaio(raio), esperado)
+
+def test_vizinhos_ordenados_por_distancia():
+    coordenadas = gerarCoordenadas(200, 3)
+    vizinhos = IndiceVizinhosOrdenados.deCoordenadas(coordenadas, 20)
+
+    for inicio, fim in zip(vizinhos.ponteiros[:-1], vizinhos.ponteiros[1:]):
+        assert np.all(np.diff(vizinhos.distancias[inicio:fim]) >= 0)
+
+    with pytest.raises(ValueError):
+        vizinhos.indiceParaRaio(21)
+
+def test_vizinhos_ordenados_instancia_de_exemplo():
+    vizinhos = IndiceVizinhosOrdenados.deDistancias(distanciasFazendas, 15)
+
+    for raio in (5, 10, 15):
+        verificarIguais(vizinhos.indiceParaRaio(raio), IndiceCobertura(distanciasFazendas, raio))
+
+@pytest.mark.parametrize('raio', [5, 10])
+def test_avaliacao_esparsa_igual_a_densa(raio):
+    random.seed(4)
+    indice = IndiceCobertura(distanciasFazendas, raio)
+    populacao = [gerarSolucaoAleatoria(indice) for _ in range(50)]
+    # Indivíduos que não cobrem todas as fazendas também precisam da cobertura correta
+    populacao += [1, 0b101, 1 << 39]
+
+    aptidoes, coberturas = avaliarLote(populacao, indice)
+    aptidoesEsparsas, coberturasEsparsas = avaliarLoteEsparso(populacao, indice)
+
+    assert np.allclose(aptidoesEsparsas, aptidoes)
+    assert np.array_equal(coberturasEsparsas, coberturas)